@@ -149,7 +149,7 @@ class Settings(BaseSettings):
         """Indica si está en entorno de producción"""
         return self.ENVIRONMENT.lower() == "production"
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Factory function para evitar instanciación temprana"""
     return Settings()
\ No newline at end of file
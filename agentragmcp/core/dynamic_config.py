@@ -3,6 +3,8 @@ Gestor de configuración dinámico para AgentRagMCP
 Permite configuraciones personalizadas por RAG y carga dinámica
 """
 import os
+import copy
+import functools
 import yaml
 import json
 from typing import Dict, List, Any, Optional, Union
@@ -13,6 +15,33 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Parser y emisor YAML en C (libyaml) si están disponibles; si no, los de Python
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parsea un archivo YAML; mtime y tamaño forman parte de la clave de caché"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_yaml_cached(path: Union[str, Path]) -> Any:
+    """
+    Carga un archivo YAML reutilizando el parseo mientras el archivo no cambie
+    
+    Args:
+        path: Ruta del archivo YAML
+        
+    Returns:
+        Copia de los datos parseados, que el llamador puede modificar libremente
+    """
+    stat = os.stat(path)
+    return copy.deepcopy(_parse_yaml_file(os.fspath(path), stat.st_mtime_ns, stat.st_size))
+
 @dataclass
 class VectorStoreConfig:
     """Configuración de vectorstore"""
@@ -165,8 +194,7 @@ class ConfigManager:
         try:
             # Cargar datos según el formato
             if config_path.suffix in [".yaml", ".yml"]:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                data = _load_yaml_cached(config_path)
             else:  # JSON
                 with open(config_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -238,8 +266,7 @@ class ConfigManager:
             return None
         
         try:
-            with open(agents_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = _load_yaml_cached(agents_file)
             
             agents_data = data.get("agents", {})
             if agent_name not in agents_data:
@@ -356,7 +383,7 @@ class ConfigManager:
             for topic, config in sample_rags.items():
                 config_file = self.config_base_path / "rags" / f"{topic}.yaml"
                 with open(config_file, 'w', encoding='utf-8') as f:
-                    yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+                    yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
             
             # 2. Configuración de agentes mejorada
             sample_agents = {
@@ -461,7 +488,7 @@ class ConfigManager:
             # Guardar configuración de agentes
             agents_file = self.config_base_path / "agents.yaml"
             with open(agents_file, 'w', encoding='utf-8') as f:
-                yaml.dump(sample_agents, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(sample_agents, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
             
             logger.info("Configuraciones de ejemplo creadas exitosamente")
             return True
@@ -567,10 +594,10 @@ class ConfigManager:
         
         # Guardar configuraciones
         with open(rags_path / "plants.yaml", 'w', encoding='utf-8') as f:
-            yaml.dump(plants_config, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(plants_config, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
         
         with open(rags_path / "pathology.yaml", 'w', encoding='utf-8') as f:
-            yaml.dump(pathology_config, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(pathology_config, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
         
         # Configuración para un RAG personalizado de ejemplo
         custom_config = {
@@ -603,7 +630,7 @@ Enfócate en técnicas respetuosas con el medio ambiente, biodiversidad y sosten
         }
         
         with open(rags_path / "eco_agriculture.yaml", 'w', encoding='utf-8') as f:
-            yaml.dump(custom_config, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(custom_config, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
     
     def _create_sample_agent_config(self):
         """Crea configuración de agentes de ejemplo"""
@@ -691,7 +718,7 @@ Enfócate en técnicas respetuosas con el medio ambiente, biodiversidad y sosten
         
         agents_file = self.config_base_path / "agents.yaml"
         with open(agents_file, 'w', encoding='utf-8') as f:
-            yaml.dump(agents_config, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(agents_config, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
     
     def get_all_rag_configs(self) -> Dict[str, RAGTopicConfig]:
         """Obtiene todas las configuraciones RAG disponibles"""
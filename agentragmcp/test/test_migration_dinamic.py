@@ -0,0 +1,56 @@
+"""
+Tests para el recuento de agentes del script de migración
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "migration_dinamic.py"
+
+@pytest.fixture(scope="module")
+def migration():
+    """Carga scripts/migration_dinamic.py como módulo"""
+    spec = importlib.util.spec_from_file_location("migration_dinamic", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class TestCountAgents:
+    """Tests para _count_agents frente al contador de eventos de libyaml"""
+
+    @pytest.mark.parametrize("agent_names", [
+        ["plants", "pathology", "general"],
+        ["jardinería", "fruta.v2", "2024_plan", "plants"],
+        ["yes", "null", "- x", "? q"],
+        ["a:b", "c"],
+    ])
+    def test_emitted_keys(self, migration, tmp_path, agent_names):
+        """Test que cuenta bien las claves tal y como las escribe _dump_yaml"""
+        agents_file = tmp_path / "agents.yaml"
+        migration._dump_yaml({"agents": {name: {"enabled": True} for name in agent_names}},
+                             agents_file)
+
+        assert migration._count_agents(agents_file) == len(agent_names)
+        assert migration._count_mapping_entries(agents_file, "agents") == len(agent_names)
+
+    def test_quoted_keys(self, migration, tmp_path):
+        """Test que cuenta claves entre comillas simples y dobles"""
+        agents_file = tmp_path / "agents.yaml"
+        agents_file.write_text(
+            'agents:\n'
+            '  "quoted key": {}\n'
+            "  'single''s': {}\n"
+            '  "a:b": 1\n'
+            '  plain: 2\n',
+            encoding="utf-8"
+        )
+
+        assert migration._count_agents(agents_file) == 4
+
+    def test_non_mapping_block_falls_back(self, migration, tmp_path):
+        """Test que un bloque agents: que no es un mapping no se cuenta como agentes"""
+        agents_file = tmp_path / "agents.yaml"
+        agents_file.write_text("agents:\n  - plants\n  - pathology\n", encoding="utf-8")
+
+        assert migration._count_agents(agents_file) == 0
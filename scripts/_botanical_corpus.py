@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Textos botánicos básicos que crea download_agricultural_data.py
+
+Los textos se guardan ya sin espacios iniciales/finales y se codifican a
+UTF-8 una única vez al importar el módulo.
+"""
+from typing import Tuple
+
+PHOTOSYNTHESIS_BASICS = """FOTOSÍNTESIS: PROCESO FUNDAMENTAL DE LAS PLANTAS
+
+La fotosíntesis es el proceso biológico más importante de la Tierra, mediante el cual las plantas convierten la energía lumínica en energía química.
+
+DEFINICIÓN:
+La fotosíntesis es el proceso por el cual las plantas utilizan la luz solar, dióxido de carbono (CO₂) y agua (H₂O) para producir glucosa (C₆H₁₂O₆) y oxígeno (O₂).
+
+ECUACIÓN GENERAL:
+6CO₂ + 6H₂O + energía lumínica → C₆H₁₂O₆ + 6O₂
+
+UBICACIÓN:
+- Principalmente en las hojas
+- En estructuras llamadas cloroplastos
+- Contienen clorofila (pigmento verde)
+
+FASES DEL PROCESO:
+
+1. REACCIONES LUMINOSAS (Fase Clara):
+- Ocurren en los tilacoides
+- Captura de energía lumínica
+- Fotólisis del agua (H₂O → H⁺ + e⁻ + ½O₂)
+- Síntesis de ATP y NADPH
+- Liberación de oxígeno
+
+2. CICLO DE CALVIN (Fase Oscura):
+- Ocurre en el estroma del cloroplasto
+- No requiere luz directa
+- Fijación del CO₂ atmosférico
+- Síntesis de glucosa
+- Utiliza ATP y NADPH de la fase luminosa
+
+FACTORES QUE AFECTAN LA FOTOSÍNTESIS:
+- Intensidad lumínica
+- Concentración de CO₂
+- Temperatura
+- Disponibilidad de agua
+- Concentración de clorofila
+
+IMPORTANCIA BIOLÓGICA:
+- Producción del oxígeno atmosférico
+- Base de todas las cadenas alimentarias
+- Regulación del CO₂ atmosférico
+- Fuente primaria de energía en los ecosistemas
+
+TIPOS DE FOTOSÍNTESIS:
+- C3: La mayoría de plantas (trigo, arroz, soja)
+- C4: Plantas adaptadas a climas cálidos (maíz, caña de azúcar)
+- CAM: Plantas suculentas (cactus, piña)
+
+La fotosíntesis es esencial para la vida en la Tierra, ya que proporciona el oxígeno que respiramos y la energía que sustenta prácticamente todos los ecosistemas."""
+
+PLANT_CLASSIFICATION = """CLASIFICACIÓN DE LAS PLANTAS
+
+La taxonomía vegetal organiza las plantas según sus características evolutivas y morfológicas.
+
+REINO PLANTAE:
+Las plantas son organismos eucariotas, autótrofos y principalmente terrestres.
+
+PRINCIPALES DIVISIONES:
+
+1. BRYOPHYTA (Briófitos):
+- Musgos, hepáticas y antoceros
+- Sin tejidos vasculares verdaderos
+- Dependientes del agua para reproducción
+- Gametófito dominante
+- Tamaño pequeño (pocos centímetros)
+
+Ejemplos: Musgo común (Bryum), Hepática (Marchantia)
+
+2. PTERIDOPHYTA (Pteridófitos):
+- Helechos y plantas afines
+- Con tejidos vasculares (xilema y floema)
+- Sin semillas
+- Esporófito dominante
+- Reproducción por esporas
+
+Ejemplos: Helecho común (Pteridium), Cola de caballo (Equisetum)
+
+3. GYMNOSPERMAE (Gimnospermas):
+- Plantas con semillas desnudas
+- Sin frutos verdaderos
+- Generalmente hojas aciculares
+- Flores unisexuales simples (conos)
+- Adaptadas a climas fríos
+
+Ejemplos: Pino (Pinus), Abeto (Abies), Ciprés (Cupressus)
+
+4. ANGIOSPERMAE (Angiospermas):
+- Plantas con flores verdaderas
+- Semillas protegidas en frutos
+- Mayor diversidad vegetal
+- Adaptadas a múltiples ambientes
+
+SUBDIVISIONES DE ANGIOSPERMAS:
+
+A. MONOCOTILEDÓNEAS:
+- Un solo cotiledón en la semilla
+- Hojas con nervación paralela
+- Flores con partes en múltiplos de 3
+- Sistema radicular fasciculado
+- Crecimiento primario únicamente
+
+Familias importantes:
+- Poaceae (gramíneas): trigo, arroz, maíz
+- Liliaceae (lirios): cebolla, ajo, tulipán
+- Orchidaceae (orquídeas): vainilla, orquídeas
+
+B. DICOTILEDÓNEAS:
+- Dos cotiledones en la semilla
+- Hojas con nervación reticulada
+- Flores con partes en múltiplos de 4 o 5
+- Sistema radicular pivotante
+- Crecimiento secundario (formación de madera)
+
+Familias importantes:
+- Rosaceae (rosáceas): rosa, manzano, cerezo
+- Fabaceae (leguminosas): judía, guisante, alfalfa
+- Solanaceae (solanáceas): tomate, patata, pimiento
+
+NOMENCLATURA BINOMIAL:
+Sistema creado por Linneo:
+- Género + especie
+- Ejemplo: Solanum lycopersicum (tomate)
+- Nombres en latín o latinizados
+- Sistema universal para científicos
+
+CRITERIOS DE CLASIFICACIÓN:
+- Morfología (forma y estructura)
+- Anatomía (tejidos internos)
+- Fisiología (procesos biológicos)
+- Genética (ADN y evolución)
+- Reproducción (tipo de flores, frutos)
+
+Esta clasificación ayuda a entender las relaciones evolutivas entre plantas y predecir características compartidas."""
+
+PLANT_DISEASES_INTRO = """INTRODUCCIÓN A LAS ENFERMEDADES DE PLANTAS
+
+Las enfermedades vegetales son alteraciones en el funcionamiento normal de las plantas causadas por patógenos o factores ambientales.
+
+TIPOS DE PATÓGENOS:
+
+1. HONGOS (Enfermedades Fúngicas):
+- Causan el 80% de las enfermedades vegetales
+- Estructuras: micelio, esporas, cuerpos fructíferos
+- Transmisión: aire, agua, suelo, insectos
+- Condiciones favorables: humedad alta, temperaturas moderadas
+
+Ejemplos comunes:
+- Mildiu (Plasmopara viticola): en vid
+- Oídio (Erysiphe graminis): en cereales
+- Roya (Puccinia graminis): en trigo
+- Alternaria (Alternaria solani): en tomate
+
+2. BACTERIAS (Enfermedades Bacterianas):
+- Organismos unicelulares
+- Penetran por heridas o aberturas naturales
+- Transmisión: agua, insectos, herramientas
+- Síntomas: marchitez, manchas acuosas, tumores
+
+Ejemplos:
+- Erwinia amylovora: fuego bacteriano en rosáceas
+- Xanthomonas: mancha bacteriana en tomate
+- Agrobacterium: tumores en muchas plantas
+
+3. VIRUS (Enfermedades Virales):
+- Parásitos obligados intracelulares
+- Transmisión: insectos vectores, injertos, semillas
+- Síntomas: mosaicos, deformaciones, enanismo
+- Difíciles de controlar
+
+Ejemplos:
+- Virus del mosaico del tabaco (TMV)
+- Virus del mosaico del pepino (CMV)
+- Virus de la tristeza de los cítricos
+
+4. NEMATODOS:
+- Gusanos microscópicos del suelo
+- Atacan raíces principalmente
+- Síntomas: agallas, necrosis radicular, enanismo
+- Transmisión: suelo infestado
+
+Ejemplos:
+- Meloidogyne (nematodo agallador)
+- Heterodera (nematodo del quiste)
+
+SÍNTOMAS PRINCIPALES:
+
+FOLIARES:
+- Manchas: circulares, angulares, irregulares
+- Mosaicos: alternancias de color verde
+- Amarilleo: clorosis generalizada o localizada
+- Necrosis: muerte de tejidos (marrón/negro)
+- Deformaciones: rizado, abollado
+
+RADICULARES:
+- Pudriciones: tejidos blandos y oscuros
+- Agallas: hinchazones anormales
+- Necrosis: raíces muertas
+
+VASCULARES:
+- Marchitez: pérdida de turgencia
+- Decoloraciones: cambios en vasos conductores
+
+FACTORES PREDISPONENTES:
+- Estrés hídrico (exceso o deficiencia)
+- Temperaturas extremas
+- Nutrición desequilibrada
+- Heridas y daños mecánicos
+- Densidad excesiva de plantación
+- Falta de ventilación
+
+TRIÁNGULO DE LA ENFERMEDAD:
+Para que ocurra una enfermedad se necesitan:
+1. Huésped susceptible
+2. Patógeno virulento  
+3. Ambiente favorable
+
+ESTRATEGIAS DE CONTROL:
+
+PREVENTIVO:
+- Variedades resistentes
+- Rotación de cultivos
+- Saneamiento (eliminación de restos)
+- Desinfección de herramientas
+- Manejo del riego
+
+CULTURAL:
+- Espaciamiento adecuado
+- Fertilización equilibrada
+- Poda sanitaria
+- Control de malas hierbas
+
+BIOLÓGICO:
+- Microorganismos antagonistas
+- Extractos vegetales
+- Feromonas y trampas
+
+QUÍMICO:
+- Fungicidas, bactericidas
+- Aplicación preventiva y curativa
+- Rotación de materias activas
+- Respeto a dosis y plazo de seguridad
+
+El manejo integrado combina múltiples estrategias para un control efectivo y sostenible."""
+
+# (nombre de archivo, temática, contenido en bytes)
+BOTANICAL_TEXTS: Tuple[Tuple[str, str, bytes], ...] = (
+    ("photosynthesis_basics.txt", "general", PHOTOSYNTHESIS_BASICS.encode("utf-8")),
+    ("plant_classification.txt", "general", PLANT_CLASSIFICATION.encode("utf-8")),
+    ("plant_diseases_intro.txt", "pathology", PLANT_DISEASES_INTRO.encode("utf-8")),
+)
@@ -2,7 +2,9 @@
 """
 Script de diagnóstico para problemas de configuración
 """
+import mmap
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -10,6 +12,13 @@ from pathlib import Path
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
+# Variables del .env que suelen dar problemas al parsear la configuración
+PROBLEMATIC_VARS = ('CORS_ORIGINS', 'RAG_TOPICS', 'SPECIFIC_SPECIES', 'MCP_SERVERS')
+_PROBLEMATIC_VARS_RE = re.compile(
+    rb'^(' + b'|'.join(v.encode() for v in PROBLEMATIC_VARS) + rb')=(.*)$',
+    re.MULTILINE,
+)
+
 def check_env_file():
     """Verifica el archivo .env"""
     env_path = root_dir / ".env"
@@ -25,34 +34,43 @@ def check_env_file():
     if env_path.exists():
         print(f"📏 Tamaño .env: {env_path.stat().st_size} bytes")
         
-        # Leer contenido del .env
+        # Leer contenido del .env con una única pasada sobre el mmap
         try:
-            with open(env_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            found = {}
+            line_count = 0
+            size = env_path.stat().st_size
+            if size:
+                with open(env_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    pos = 0
+                    for match in _PROBLEMATIC_VARS_RE.finditer(mm):
+                        var = match.group(1).decode('utf-8')
+                        if var in found:
+                            continue
+                        line_count += mm[pos:match.start()].count(b'\n')
+                        pos = match.start()
+                        value = match.group(2).rstrip(b'\r').decode('utf-8')
+                        found[var] = (line_count + 1, value)
+                        if len(found) == len(PROBLEMATIC_VARS):
+                            break
+                    line_count += mm[pos:].count(b'\n')
+                    if mm[size - 1] != ord('\n'):
+                        line_count += 1
             
-            print(f"📝 Líneas en .env: {len(content.splitlines())}")
+            print(f"📝 Líneas en .env: {line_count}")
             
             # Buscar CORS_ORIGINS específicamente
-            lines = content.splitlines()
-            cors_line = None
-            for i, line in enumerate(lines):
-                if line.startswith('CORS_ORIGINS'):
-                    cors_line = (i + 1, line)
-                    break
-            
-            if cors_line:
-                print(f"🎯 CORS_ORIGINS encontrado en línea {cors_line[0]}: {cors_line[1]}")
+            if 'CORS_ORIGINS' in found:
+                line_number, value = found['CORS_ORIGINS']
+                print(f"🎯 CORS_ORIGINS encontrado en línea {line_number}: CORS_ORIGINS={value}")
             else:
                 print("⚠️  CORS_ORIGINS no encontrado en .env")
             
             # Mostrar variables que pueden causar problemas
-            problematic_vars = ['CORS_ORIGINS', 'RAG_TOPICS', 'SPECIFIC_SPECIES', 'MCP_SERVERS']
             print(f"\n🔍 VARIABLES PROBLEMÁTICAS:")
-            for var in problematic_vars:
-                for line in lines:
-                    if line.startswith(f'{var}='):
-                        print(f"   {var}: {line.split('=', 1)[1]}")
-                        break
+            for var in PROBLEMATIC_VARS:
+                if var in found:
+                    print(f"   {var}: {found[var][1]}")
                 else:
                     print(f"   {var}: (no definida)")
         
@@ -62,8 +80,12 @@ def check_env_file():
     else:
         print("❌ Archivo .env no existe")
 
-def test_config_loading():
-    """Prueba cargar la configuración"""
+def test_config_loading(reload: bool = False):
+    """Prueba cargar la configuración
+
+    Si ``reload`` es True se descarta la configuración cacheada para que
+    se vuelva a leer el .env (p.ej. tras crear uno nuevo).
+    """
     print(f"\n🧪 PRUEBA DE CARGA DE CONFIGURACIÓN")
     print("=" * 40)
     
@@ -72,6 +94,9 @@ def test_config_loading():
         from agentragmcp.core.config import get_settings
         print("✅ Importación exitosa")
         
+        if reload:
+            get_settings.cache_clear()
+        
         # Intentar crear configuración
         settings = get_settings()
         print("✅ Configuración creada")
@@ -154,7 +179,7 @@ def main():
         print(f"\n🔧 INTENTANDO CREAR CONFIGURACIÓN MÍNIMA...")
         if create_minimal_env():
             print(f"\n🔄 PROBANDO NUEVAMENTE...")
-            test_config_loading()
+            test_config_loading(reload=True)
     
     print(f"\n💡 PRÓXIMOS PASOS:")
     print(f"1. Asegúrate de que el archivo .env esté en: {root_dir}")
@@ -4,7 +4,8 @@ Script para descargar datos agrícolas y botánicos de fuentes públicas
 """
 import os
 import sys
-import requests
+import json
+import hashlib
 import argparse
 from pathlib import Path
 from typing import List, Dict, Any
@@ -17,6 +18,7 @@ root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
 from agentragmcp.core.monitoring import setup_logging
+from _botanical_corpus import BOTANICAL_TEXTS
 
 class AgriculturalDataDownloader:
     """Descargador de datos agrícolas desde fuentes públicas"""
@@ -31,23 +33,128 @@ class AgriculturalDataDownloader:
         
         self.documents_path = self.base_path / "data" / "documents"
         
+        # Caché de descargas: URL -> {etag, last_modified, sha256, size}
+        self.download_cache_path = self.documents_path / ".download_cache.json"
+        self._download_cache = None
+        
         # Headers para requests
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (compatible; AgentRagMCP-DataCollector/1.0)'
         }
+        
+        # Sesión persistente (se crea en la primera descarga)
+        self._session = None
+    
+    @property
+    def session(self):
+        """Sesión HTTP que reutiliza conexiones TCP/TLS entre descargas"""
+        if self._session is None:
+            # Import diferido: requests solo se carga si realmente se descarga
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            session.headers.update(self.headers)
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504)
+                )
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
     
     def setup_directories(self):
         """Crea directorios necesarios"""
-        for topic in ["plants", "pathology", "general"]:
-            topic_path = self.documents_path / topic
-            topic_path.mkdir(parents=True, exist_ok=True)
+        self.documents_path.mkdir(parents=True, exist_ok=True)
+        with os.scandir(self.documents_path) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+        
+        for topic in ("plants", "pathology", "general"):
+            if topic not in existing:
+                (self.documents_path / topic).mkdir(exist_ok=True)
+    
+    @staticmethod
+    def _file_sha256(filepath: Path) -> str:
+        """Calcula el SHA-256 de un archivo sin cargarlo entero en memoria"""
+        with open(filepath, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+    
+    def _get_download_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Carga (una sola vez) la caché de descargas desde disco"""
+        if self._download_cache is None:
+            try:
+                with open(self.download_cache_path, 'r', encoding='utf-8') as f:
+                    self._download_cache = json.load(f)
+            except (OSError, ValueError):
+                self._download_cache = {}
+        return self._download_cache
+    
+    def _save_download_cache(self):
+        """Persiste la caché de descargas"""
+        try:
+            self.download_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.download_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._get_download_cache(), f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"No se pudo guardar la caché de descargas: {e}")
+    
+    def _is_cached_copy_valid(self, entry: Dict[str, Any], filepath: Path) -> bool:
+        """Comprueba que el archivo local coincide con lo registrado en caché"""
+        if not entry or not filepath.is_file():
+            return False
+        if filepath.stat().st_size != entry.get("size"):
+            return False
+        return self._file_sha256(filepath) == entry.get("sha256")
+    
+    @staticmethod
+    def _preallocate(fd: int, size: int):
+        """Reserva el espacio del archivo y avisa al kernel de escritura secuencial"""
+        if size <= 0:
+            return
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, size)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            # No todos los sistemas de archivos lo soportan; no es crítico
+            pass
     
     def download_file(self, url: str, filepath: Path, max_size_mb: int = 50) -> bool:
-        """Descarga un archivo desde una URL"""
+        """Descarga un archivo desde una URL
+        
+        Si el archivo ya se descargó antes y su contenido local no ha cambiado,
+        se hace una petición condicional (ETag / Last-Modified) y, si el
+        servidor responde 304, se evita volver a descargarlo.
+        """
         try:
+            cache = self._get_download_cache()
+            entry = cache.get(url)
+            headers = {}
+            if self._is_cached_copy_valid(entry, filepath):
+                if entry.get("etag"):
+                    headers['If-None-Match'] = entry["etag"]
+                if entry.get("last_modified"):
+                    headers['If-Modified-Since'] = entry["last_modified"]
+            
             self.logger.info(f"Descargando: {url}")
             
-            response = requests.get(url, headers=self.headers, stream=True, timeout=30)
+            response = self.session.get(url, headers=headers, stream=True, timeout=30)
+            if response.status_code == 304:
+                self.logger.info(f"Sin cambios, se reutiliza: {filepath}")
+                return True
             response.raise_for_status()
             
             # Verificar tamaño
@@ -58,13 +165,29 @@ class AgriculturalDataDownloader:
                     self.logger.warning(f"Archivo demasiado grande ({size_mb:.1f}MB): {url}")
                     return False
             
-            # Descargar archivo
+            # Descargar archivo calculando el hash mientras se escribe
             filepath.parent.mkdir(parents=True, exist_ok=True)
             
+            digest = hashlib.sha256()
+            size = 0
             with open(filepath, 'wb') as f:
+                if content_length:
+                    self._preallocate(f.fileno(), int(content_length))
                 for chunk in response.iter_content(chunk_size=8192):
                     if chunk:
                         f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                # Content-Length puede no coincidir (p.ej. respuestas comprimidas)
+                f.truncate(size)
+            
+            cache[url] = {
+                "etag": response.headers.get('etag'),
+                "last_modified": response.headers.get('last-modified'),
+                "sha256": digest.hexdigest(),
+                "size": size
+            }
+            self._save_download_cache()
             
             self.logger.info(f"Descargado: {filepath}")
             return True
@@ -143,272 +266,10 @@ class AgriculturalDataDownloader:
         """Crea textos botánicos básicos desde fuentes públicas"""
         self.logger.info("Creando textos botánicos básicos...")
         
-        botanical_texts = {
-            "photosynthesis_basics.txt": """
-FOTOSÍNTESIS: PROCESO FUNDAMENTAL DE LAS PLANTAS
-
-La fotosíntesis es el proceso biológico más importante de la Tierra, mediante el cual las plantas convierten la energía lumínica en energía química.
-
-DEFINICIÓN:
-La fotosíntesis es el proceso por el cual las plantas utilizan la luz solar, dióxido de carbono (CO₂) y agua (H₂O) para producir glucosa (C₆H₁₂O₆) y oxígeno (O₂).
-
-ECUACIÓN GENERAL:
-6CO₂ + 6H₂O + energía lumínica → C₆H₁₂O₆ + 6O₂
-
-UBICACIÓN:
-- Principalmente en las hojas
-- En estructuras llamadas cloroplastos
-- Contienen clorofila (pigmento verde)
-
-FASES DEL PROCESO:
-
-1. REACCIONES LUMINOSAS (Fase Clara):
-- Ocurren en los tilacoides
-- Captura de energía lumínica
-- Fotólisis del agua (H₂O → H⁺ + e⁻ + ½O₂)
-- Síntesis de ATP y NADPH
-- Liberación de oxígeno
-
-2. CICLO DE CALVIN (Fase Oscura):
-- Ocurre en el estroma del cloroplasto
-- No requiere luz directa
-- Fijación del CO₂ atmosférico
-- Síntesis de glucosa
-- Utiliza ATP y NADPH de la fase luminosa
-
-FACTORES QUE AFECTAN LA FOTOSÍNTESIS:
-- Intensidad lumínica
-- Concentración de CO₂
-- Temperatura
-- Disponibilidad de agua
-- Concentración de clorofila
-
-IMPORTANCIA BIOLÓGICA:
-- Producción del oxígeno atmosférico
-- Base de todas las cadenas alimentarias
-- Regulación del CO₂ atmosférico
-- Fuente primaria de energía en los ecosistemas
-
-TIPOS DE FOTOSÍNTESIS:
-- C3: La mayoría de plantas (trigo, arroz, soja)
-- C4: Plantas adaptadas a climas cálidos (maíz, caña de azúcar)
-- CAM: Plantas suculentas (cactus, piña)
-
-La fotosíntesis es esencial para la vida en la Tierra, ya que proporciona el oxígeno que respiramos y la energía que sustenta prácticamente todos los ecosistemas.
-            """,
-            
-            "plant_classification.txt": """
-CLASIFICACIÓN DE LAS PLANTAS
-
-La taxonomía vegetal organiza las plantas según sus características evolutivas y morfológicas.
-
-REINO PLANTAE:
-Las plantas son organismos eucariotas, autótrofos y principalmente terrestres.
-
-PRINCIPALES DIVISIONES:
-
-1. BRYOPHYTA (Briófitos):
-- Musgos, hepáticas y antoceros
-- Sin tejidos vasculares verdaderos
-- Dependientes del agua para reproducción
-- Gametófito dominante
-- Tamaño pequeño (pocos centímetros)
-
-Ejemplos: Musgo común (Bryum), Hepática (Marchantia)
-
-2. PTERIDOPHYTA (Pteridófitos):
-- Helechos y plantas afines
-- Con tejidos vasculares (xilema y floema)
-- Sin semillas
-- Esporófito dominante
-- Reproducción por esporas
-
-Ejemplos: Helecho común (Pteridium), Cola de caballo (Equisetum)
-
-3. GYMNOSPERMAE (Gimnospermas):
-- Plantas con semillas desnudas
-- Sin frutos verdaderos
-- Generalmente hojas aciculares
-- Flores unisexuales simples (conos)
-- Adaptadas a climas fríos
-
-Ejemplos: Pino (Pinus), Abeto (Abies), Ciprés (Cupressus)
-
-4. ANGIOSPERMAE (Angiospermas):
-- Plantas con flores verdaderas
-- Semillas protegidas en frutos
-- Mayor diversidad vegetal
-- Adaptadas a múltiples ambientes
-
-SUBDIVISIONES DE ANGIOSPERMAS:
-
-A. MONOCOTILEDÓNEAS:
-- Un solo cotiledón en la semilla
-- Hojas con nervación paralela
-- Flores con partes en múltiplos de 3
-- Sistema radicular fasciculado
-- Crecimiento primario únicamente
-
-Familias importantes:
-- Poaceae (gramíneas): trigo, arroz, maíz
-- Liliaceae (lirios): cebolla, ajo, tulipán
-- Orchidaceae (orquídeas): vainilla, orquídeas
-
-B. DICOTILEDÓNEAS:
-- Dos cotiledones en la semilla
-- Hojas con nervación reticulada
-- Flores con partes en múltiplos de 4 o 5
-- Sistema radicular pivotante
-- Crecimiento secundario (formación de madera)
-
-Familias importantes:
-- Rosaceae (rosáceas): rosa, manzano, cerezo
-- Fabaceae (leguminosas): judía, guisante, alfalfa
-- Solanaceae (solanáceas): tomate, patata, pimiento
-
-NOMENCLATURA BINOMIAL:
-Sistema creado por Linneo:
-- Género + especie
-- Ejemplo: Solanum lycopersicum (tomate)
-- Nombres en latín o latinizados
-- Sistema universal para científicos
-
-CRITERIOS DE CLASIFICACIÓN:
-- Morfología (forma y estructura)
-- Anatomía (tejidos internos)
-- Fisiología (procesos biológicos)
-- Genética (ADN y evolución)
-- Reproducción (tipo de flores, frutos)
-
-Esta clasificación ayuda a entender las relaciones evolutivas entre plantas y predecir características compartidas.
-            """,
-            
-            "plant_diseases_intro.txt": """
-INTRODUCCIÓN A LAS ENFERMEDADES DE PLANTAS
-
-Las enfermedades vegetales son alteraciones en el funcionamiento normal de las plantas causadas por patógenos o factores ambientales.
-
-TIPOS DE PATÓGENOS:
-
-1. HONGOS (Enfermedades Fúngicas):
-- Causan el 80% de las enfermedades vegetales
-- Estructuras: micelio, esporas, cuerpos fructíferos
-- Transmisión: aire, agua, suelo, insectos
-- Condiciones favorables: humedad alta, temperaturas moderadas
-
-Ejemplos comunes:
-- Mildiu (Plasmopara viticola): en vid
-- Oídio (Erysiphe graminis): en cereales
-- Roya (Puccinia graminis): en trigo
-- Alternaria (Alternaria solani): en tomate
-
-2. BACTERIAS (Enfermedades Bacterianas):
-- Organismos unicelulares
-- Penetran por heridas o aberturas naturales
-- Transmisión: agua, insectos, herramientas
-- Síntomas: marchitez, manchas acuosas, tumores
-
-Ejemplos:
-- Erwinia amylovora: fuego bacteriano en rosáceas
-- Xanthomonas: mancha bacteriana en tomate
-- Agrobacterium: tumores en muchas plantas
-
-3. VIRUS (Enfermedades Virales):
-- Parásitos obligados intracelulares
-- Transmisión: insectos vectores, injertos, semillas
-- Síntomas: mosaicos, deformaciones, enanismo
-- Difíciles de controlar
-
-Ejemplos:
-- Virus del mosaico del tabaco (TMV)
-- Virus del mosaico del pepino (CMV)
-- Virus de la tristeza de los cítricos
-
-4. NEMATODOS:
-- Gusanos microscópicos del suelo
-- Atacan raíces principalmente
-- Síntomas: agallas, necrosis radicular, enanismo
-- Transmisión: suelo infestado
-
-Ejemplos:
-- Meloidogyne (nematodo agallador)
-- Heterodera (nematodo del quiste)
-
-SÍNTOMAS PRINCIPALES:
-
-FOLIARES:
-- Manchas: circulares, angulares, irregulares
-- Mosaicos: alternancias de color verde
-- Amarilleo: clorosis generalizada o localizada
-- Necrosis: muerte de tejidos (marrón/negro)
-- Deformaciones: rizado, abollado
-
-RADICULARES:
-- Pudriciones: tejidos blandos y oscuros
-- Agallas: hinchazones anormales
-- Necrosis: raíces muertas
-
-VASCULARES:
-- Marchitez: pérdida de turgencia
-- Decoloraciones: cambios en vasos conductores
-
-FACTORES PREDISPONENTES:
-- Estrés hídrico (exceso o deficiencia)
-- Temperaturas extremas
-- Nutrición desequilibrada
-- Heridas y daños mecánicos
-- Densidad excesiva de plantación
-- Falta de ventilación
-
-TRIÁNGULO DE LA ENFERMEDAD:
-Para que ocurra una enfermedad se necesitan:
-1. Huésped susceptible
-2. Patógeno virulento  
-3. Ambiente favorable
-
-ESTRATEGIAS DE CONTROL:
-
-PREVENTIVO:
-- Variedades resistentes
-- Rotación de cultivos
-- Saneamiento (eliminación de restos)
-- Desinfección de herramientas
-- Manejo del riego
-
-CULTURAL:
-- Espaciamiento adecuado
-- Fertilización equilibrada
-- Poda sanitaria
-- Control de malas hierbas
-
-BIOLÓGICO:
-- Microorganismos antagonistas
-- Extractos vegetales
-- Feromonas y trampas
-
-QUÍMICO:
-- Fungicidas, bactericidas
-- Aplicación preventiva y curativa
-- Rotación de materias activas
-- Respeto a dosis y plazo de seguridad
-
-El manejo integrado combina múltiples estrategias para un control efectivo y sostenible.
-            """
-        }
-        
         created_files = []
-        for filename, content in botanical_texts.items():
-            if filename.endswith('intro.txt'):
-                topic = "pathology"
-            elif filename.endswith('classification.txt') or filename.endswith('basics.txt'):
-                topic = "general"
-            else:
-                topic = "general"
-            
+        for filename, topic, data in BOTANICAL_TEXTS:
             filepath = self.documents_path / topic / filename
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content.strip())
+            filepath.write_bytes(data)
             
             created_files.append(filename)
             self.logger.info(f"Creado: {filepath}")
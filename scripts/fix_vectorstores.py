@@ -1,15 +1,67 @@
+import errno
+import json
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from langchain_chroma import Chroma
-from langchain_ollama import OllamaEmbeddings
 from agentragmcp.core.config import get_settings
 from agentragmcp.core.monitoring import logger
 
+# Caché en disco de la dimensión de cada modelo de embeddings
+EMBED_DIMS_CACHE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "embed_dims.json"
+
+# Ejecutor para comprimir backups en segundo plano (se crea bajo demanda)
+_archive_executor = None
+
+class CachedQueryEmbeddings:
+    """
+    Envuelve un modelo de embeddings memorizando ``embed_query`` por texto,
+    para no repetir la llamada a Ollama con la misma consulta
+    """
+    
+    def __init__(self, embeddings, maxsize: int = 32):
+        self._embeddings = embeddings
+        self._embed_query = lru_cache(maxsize=maxsize)(embeddings.embed_query)
+    
+    def embed_documents(self, texts):
+        return self._embeddings.embed_documents(texts)
+    
+    def embed_query(self, text: str):
+        return list(self._embed_query(text))
+
+def get_embedding_dimension(embeddings, model: str, base_url: str, refresh: bool = False) -> int:
+    """
+    Devuelve la dimensión de los embeddings del modelo, consultando a Ollama
+    solo si no está ya en la caché de disco (o si se pide refresh=True)
+    """
+    key = f"{model}|{base_url}"
+    try:
+        dims = json.loads(EMBED_DIMS_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        dims = {}
+    
+    if key in dims and not refresh:
+        return dims[key]
+    
+    dimension = len(embeddings.embed_query("test"))
+    dims[key] = dimension
+    try:
+        EMBED_DIMS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        EMBED_DIMS_CACHE_PATH.write_text(json.dumps(dims, indent=2), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"No se pudo guardar la caché de dimensiones: {e}")
+    return dimension
+
 def fix_vectorstores():
     """
     Soluciona problemas de dimensionalidad en vectorstores existentes
     """
+    # Imports diferidos: cargan cientos de módulos y solo hacen falta aquí
+    from langchain_chroma import Chroma
+    from langchain_ollama import OllamaEmbeddings
+    
     print("🔧 SOLUCIONANDO PROBLEMAS DE VECTORSTORES...")
     
     settings = get_settings()
@@ -20,23 +72,39 @@ def fix_vectorstores():
     print(f"Modelo de embeddings actual: {current_embedding_model}")
     
     # Crear embeddings con modelo actual
-    embeddings = OllamaEmbeddings(
+    embeddings = CachedQueryEmbeddings(OllamaEmbeddings(
         model=current_embedding_model,
         base_url=settings.LLM_BASE_URL
-    )
+    ))
     
     # Obtener dimensión del modelo actual
-    test_embedding = embeddings.embed_query("test")
-    current_dimension = len(test_embedding)
+    current_dimension = get_embedding_dimension(
+        embeddings, current_embedding_model, settings.LLM_BASE_URL
+    )
     print(f"Dimensión actual del modelo: {current_dimension}")
     
+    # Vector de prueba con la dimensión del modelo: basta para detectar
+    # incompatibilidades sin volver a llamar a Ollama
+    test_embedding = [1.0] + [0.0] * (current_dimension - 1)
+    
     # Verificar cada vectorstore
     topics = ['plants', 'pathology', 'general', 'eco_agriculture', 'urban_gardening']
     
+    # Un único listado del directorio base en lugar de un stat por temática
+    try:
+        with os.scandir(vectorstore_base) as entries:
+            present = {
+                entry.name: entry.path
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            }
+    except FileNotFoundError:
+        present = {}
+    
     for topic in topics:
         vectorstore_path = vectorstore_base / topic
         
-        if not vectorstore_path.exists():
+        if topic not in present:
             print(f"⚠️ Vectorstore {topic} no existe: {vectorstore_path}")
             continue
             
@@ -45,21 +113,47 @@ def fix_vectorstores():
         try:
             # Intentar cargar vectorstore existente
             vectorstore = Chroma(
-                persist_directory=str(vectorstore_path),
+                persist_directory=present[topic],
                 embedding_function=embeddings
             )
             
-            # Probar una consulta simple
-            results = vectorstore.similarity_search("test", k=1)
+            # Probar una consulta simple reutilizando el vector ya calculado
+            results = vectorstore.similarity_search_by_vector(test_embedding, k=1)
             print(f"✅ Vectorstore {topic} es compatible")
             
         except Exception as e:
             error_msg = str(e)
-            if "dimension" in error_msg.lower():
-                print(f"❌ Error de dimensionalidad en {topic}: {error_msg}")
-                fix_vectorstore_dimensions(topic, vectorstore_path, embeddings)
-            else:
+            if "dimension" not in error_msg.lower():
                 print(f"⚠️ Error desconocido en {topic}: {e}")
+                continue
+            
+            # La dimensión puede venir de una caché obsoleta (p. ej. el modelo se
+            # volvió a descargar con el mismo nombre): se comprueba con Ollama
+            # antes de mover el vectorstore
+            live_dimension = get_embedding_dimension(
+                embeddings, current_embedding_model, settings.LLM_BASE_URL, refresh=True
+            )
+            if live_dimension != current_dimension:
+                print(f"🔄 Dimensión en caché obsoleta ({current_dimension}); "
+                      f"el modelo devuelve {live_dimension}")
+                current_dimension = live_dimension
+                test_embedding = [1.0] + [0.0] * (current_dimension - 1)
+                try:
+                    vectorstore = Chroma(
+                        persist_directory=present[topic],
+                        embedding_function=embeddings
+                    )
+                    vectorstore.similarity_search_by_vector(test_embedding, k=1)
+                    print(f"✅ Vectorstore {topic} es compatible")
+                    continue
+                except Exception as retry_error:
+                    error_msg = str(retry_error)
+                    if "dimension" not in error_msg.lower():
+                        print(f"⚠️ Error desconocido en {topic}: {retry_error}")
+                        continue
+            
+            print(f"❌ Error de dimensionalidad en {topic}: {error_msg}")
+            fix_vectorstore_dimensions(topic, vectorstore_path, embeddings)
 
 def fix_vectorstore_dimensions(topic: str, vectorstore_path: Path, embeddings):
     """
@@ -68,10 +162,12 @@ def fix_vectorstore_dimensions(topic: str, vectorstore_path: Path, embeddings):
     print(f"🔄 Corrigiendo dimensionalidad para {topic}...")
     
     # Hacer backup si es importante
-    backup_path = vectorstore_path.parent / f"{topic}_backup_{int(time.time())}"
+    backup_path = _new_backup_path(vectorstore_path, topic)
     try:
-        shutil.move(str(vectorstore_path), str(backup_path))
+        move_to_backup(vectorstore_path, backup_path)
         print(f"📁 Backup creado en: {backup_path}")
+        schedule_backup_archive(backup_path)
+        print(f"📦 Comprimiendo copia en: {backup_path}.tar.gz")
     except Exception as e:
         print(f"⚠️ No se pudo crear backup: {e}")
     
@@ -79,4 +175,41 @@ def fix_vectorstore_dimensions(topic: str, vectorstore_path: Path, embeddings):
     vectorstore_path.mkdir(parents=True, exist_ok=True)
     
     print(f"🗑️ Vectorstore {topic} eliminado. Necesitas recrearlo con:")
-    print(f"   python scripts/process_documents.py --topic {topic}")
\ No newline at end of file
+    print(f"   python scripts/process_documents.py --topic {topic}")
+
+def _new_backup_path(vectorstore_path: Path, topic: str) -> Path:
+    """Genera una ruta de backup que no pise uno anterior (ni su tar.gz)"""
+    while True:
+        backup_path = vectorstore_path.parent / f"{topic}_backup_{time.monotonic_ns()}"
+        if not backup_path.exists() and not Path(f"{backup_path}.tar.gz").exists():
+            return backup_path
+
+def move_to_backup(vectorstore_path: Path, backup_path: Path):
+    """
+    Mueve el vectorstore al backup con un rename atómico; solo copia los
+    datos si origen y destino están en distintos sistemas de archivos
+    """
+    try:
+        os.replace(vectorstore_path, backup_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(vectorstore_path), str(backup_path))
+
+def _archive_backup(backup_path: Path):
+    """Comprime el backup en un tar.gz junto al directorio, que se conserva"""
+    try:
+        archive = shutil.make_archive(
+            str(backup_path), 'gztar',
+            root_dir=str(backup_path.parent), base_dir=backup_path.name
+        )
+        logger.info(f"Backup comprimido en: {archive}")
+    except Exception as e:
+        logger.warning(f"No se pudo comprimir el backup {backup_path}: {e}")
+
+def schedule_backup_archive(backup_path: Path):
+    """Programa la compresión del backup sin bloquear la corrección"""
+    global _archive_executor
+    if _archive_executor is None:
+        _archive_executor = ThreadPoolExecutor(max_workers=1)
+    return _archive_executor.submit(_archive_backup, backup_path)
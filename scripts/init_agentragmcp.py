@@ -5,78 +5,184 @@ Prepara el entorno, verifica dependencias y configura los servicios
 """
 import os
 import sys
+import atexit
+import threading
+import importlib.util
 import logging
+import shutil
+import socket
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 
 # Añadir el directorio raíz al path
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
-from agentragmcp.core.config import get_settings
-from agentragmcp.core.monitoring import setup_logging
+if TYPE_CHECKING:
+    from agentragmcp.core.config import Settings
 
-def setup_directories(base_path: Path) -> bool:
+class _BufferedOutputHandler(MemoryHandler):
+    """
+    Handler en memoria que, al vaciarse, escribe todas las líneas
+    acumuladas en stdout con una única escritura
+    """
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                sys.stdout.write("".join(self.format(record) + "\n" for record in self.buffer))
+                sys.stdout.flush()
+                self.buffer.clear()
+        finally:
+            self.release()
+
+# Toda la salida del script pasa por este logger; las líneas se acumulan
+# y se vuelcan al terminar cada fase (o de inmediato si es un error)
+log = logging.getLogger("agentragmcp.init")
+log.setLevel(logging.DEBUG)
+log.propagate = False
+_output_handler = _BufferedOutputHandler(capacity=1024, flushLevel=logging.ERROR)
+_output_handler.setFormatter(logging.Formatter("%(message)s"))
+log.addHandler(_output_handler)
+
+def flush_output():
+    """Vuelca en stdout la salida acumulada de la fase actual"""
+    _output_handler.flush()
+
+# Directorios del proyecto, relativos al directorio base (ya ordenados)
+PROJECT_DIRECTORIES = tuple(sorted([
+    "data/vectorstores/plants",
+    "data/vectorstores/pathology", 
+    "data/vectorstores/general",
+    "data/configs",
+    "logs/agentragmcp",
+    "static",
+    "tests/data"
+]))
+
+@dataclass(frozen=True)
+class Layout:
+    """Rutas del proyecto calculadas una sola vez a partir del directorio base"""
+    base: Path
+    data: Path
+    env_file: Path
+    env_example: Path
+    data_readme: Path
+    directories: Tuple[Tuple[str, Path], ...]
+
+def build_layout(base_path: Path) -> Layout:
+    """Construye el ``Layout`` del proyecto para ``base_path``"""
+    data = base_path / "data"
+    return Layout(
+        base=base_path,
+        data=data,
+        env_file=base_path / ".env",
+        env_example=base_path / ".env.example",
+        data_readme=data / "README.md",
+        directories=tuple(
+            (directory, base_path / directory) for directory in PROJECT_DIRECTORIES
+        ),
+    )
+
+# Dependencias principales que se comprueban al inicializar
+DEPENDENCIES = (
+    "fastapi",
+    "langchain",
+    "langchain_chroma",
+    "langchain_ollama",
+    "pydantic",
+    "uvicorn",
+    "httpx",
+    "pyyaml"
+)
+
+# Nombre del paquete -> nombre del módulo importable (cuando difieren)
+_DEPENDENCY_IMPORT_NAMES = {"pyyaml": "yaml"}
+
+# Plantilla del README de data/ (se lee bajo demanda)
+DATA_README_TEMPLATE = Path(__file__).parent / "templates" / "data_readme.md"
+
+# Cliente HTTP compartido por todas las comprobaciones contra Ollama
+_http_client = None
+
+def get_http_client():
+    """
+    Devuelve un cliente httpx reutilizable (pool de conexiones keep-alive).
+    
+    Se crea en el primer uso y se cierra al terminar el proceso.
+    """
+    global _http_client
+    if _http_client is None:
+        import httpx
+        
+        _http_client = httpx.Client(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        )
+        atexit.register(_http_client.close)
+    return _http_client
+
+def setup_directories(layout: Layout) -> bool:
     """
     Crea la estructura de directorios necesaria.
     
     Args:
-        base_path: Directorio base del proyecto
+        layout: Rutas del proyecto
         
     Returns:
         bool: True si se crearon correctamente
     """
-    directories = [
-        "data/vectorstores/plants",
-        "data/vectorstores/pathology", 
-        "data/vectorstores/general",
-        "data/configs",
-        "logs/agentragmcp",
-        "static",
-        "tests/data"
-    ]
+    base_path = layout.base
+    base_path.mkdir(parents=True, exist_ok=True)
     
+    # Cada prefijo común (data, data/vectorstores, ...) se crea una sola vez
+    created_prefixes = set()
     success = True
-    for directory in directories:
-        dir_path = base_path / directory
+    for directory, dir_path in layout.directories:
         try:
-            dir_path.mkdir(parents=True, exist_ok=True)
-            print(f"✓ Directorio creado/verificado: {dir_path}")
+            parts = directory.split("/")
+            for i in range(1, len(parts) + 1):
+                prefix = "/".join(parts[:i])
+                if prefix in created_prefixes:
+                    continue
+                try:
+                    os.mkdir(base_path / prefix)
+                except FileExistsError:
+                    pass
+                created_prefixes.add(prefix)
+            
+            if not os.path.isdir(dir_path):
+                raise NotADirectoryError(f"{dir_path} existe pero no es un directorio")
+            log.info(f"✓ Directorio creado/verificado: {dir_path}")
         except Exception as e:
-            print(f"✗ Error creando directorio {dir_path}: {e}")
+            log.info(f"✗ Error creando directorio {dir_path}: {e}")
             success = False
     
     return success
 
-def check_dependencies() -> Dict[str, bool]:
+def check_dependencies() -> List[str]:
     """
     Verifica que las dependencias principales estén instaladas.
     
     Returns:
-        Dict con el estado de cada dependencia
+        Lista con las dependencias que faltan
     """
-    dependencies = {
-        "fastapi": False,
-        "langchain": False,
-        "langchain_chroma": False,
-        "langchain_ollama": False,
-        "pydantic": False,
-        "uvicorn": False,
-        "httpx": False,
-        "pyyaml": False
-    }
-    
-    for dep in dependencies:
-        try:
-            __import__(dep)
-            dependencies[dep] = True
-            print(f"✓ {dep} - Instalado")
-        except ImportError:
-            print(f"✗ {dep} - No encontrado")
-            dependencies[dep] = False
-    
-    return dependencies
+    missing = []
+    for dep in DEPENDENCIES:
+        # find_spec localiza el módulo sin ejecutarlo (no importa LangChain entero)
+        if importlib.util.find_spec(_DEPENDENCY_IMPORT_NAMES.get(dep, dep)) is not None:
+            log.info(f"✓ {dep} - Instalado")
+        else:
+            log.info(f"✗ {dep} - No encontrado")
+            missing.append(dep)
+    
+    return missing
 
 def verify_ollama_connection(base_url: str = "http://localhost:11434") -> bool:
     """
@@ -88,26 +194,48 @@ def verify_ollama_connection(base_url: str = "http://localhost:11434") -> bool:
     Returns:
         bool: True si la conexión es exitosa
     """
+    # Sondeo TCP rápido: si no hay nada escuchando se evita esperar al
+    # timeout de 10 s de la petición HTTP
+    url = urlparse(base_url)
+    port = url.port or (443 if url.scheme == "https" else 80)
     try:
-        import httpx
-        
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(f"{base_url}/api/tags")
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                print(f"✓ Ollama conectado - {len(models)} modelos disponibles")
-                
-                # Mostrar modelos disponibles
-                for model in models[:3]:  # Mostrar solo los primeros 3
-                    print(f"  - {model.get('name', 'Unknown')}")
-                
-                return True
-            else:
-                print(f"✗ Ollama responde con código: {response.status_code}")
-                return False
+        with socket.create_connection((url.hostname, port), timeout=0.5):
+            pass
+    except OSError as e:
+        log.info(f"✗ Ollama no accesible en {base_url}: {e}")
+        return False
+    
+    try:
+        response = get_http_client().get(f"{base_url}/api/tags")
+        if response.status_code == 200:
+            # Solo interesan el total y los nombres de los 3 primeros modelos;
+            # el resto de campos (tamaño, digest, ...) se descarta enseguida
+            models = response.json().get("models", [])
+            model_count = len(models)
+            model_names = [model.get('name', 'Unknown') for model in models[:3]]
+            del models
+            
+            log.info(f"✓ Ollama conectado - {model_count} modelos disponibles")
+            
+            # Mostrar modelos disponibles
+            for name in model_names:
+                log.info(f"  - {name}")
+            
+            return True
+        else:
+            log.info(f"✗ Ollama responde con código: {response.status_code}")
+            return False
                 
     except Exception as e:
-        print(f"✗ Error conectando con Ollama: {e}")
+        log.info(f"✗ Error conectando con Ollama: {e}")
+        return False
+
+def _dir_has_entries(path) -> bool:
+    """Indica si un directorio existe y no está vacío (lee solo la primera entrada)"""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
         return False
 
 def check_vectorstores(settings) -> Dict[str, bool]:
@@ -122,110 +250,167 @@ def check_vectorstores(settings) -> Dict[str, bool]:
     """
     vectorstores = {}
     
+    # Un único listado del directorio base; las entradas ya traen el tipo
+    base_path = os.path.abspath(settings.VECTORSTORE_BASE_PATH)
+    try:
+        with os.scandir(base_path) as entries:
+            existing = {
+                entry.name: entry
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        existing = {}
+    
     for topic in settings.RAG_TOPICS:
         path = Path(settings.get_vectorstore_path(topic))
-        exists = path.exists() and any(path.iterdir()) if path.exists() else False
+        if os.path.dirname(os.path.abspath(path)) == base_path:
+            entry = existing.get(path.name)
+            exists = entry is not None and _dir_has_entries(entry.path)
+        else:
+            # Ruta personalizada fuera del directorio base
+            exists = _dir_has_entries(path)
         vectorstores[topic] = exists
         
         status = "✓ Existe" if exists else "✗ No encontrado"
-        print(f"{status} Vectorstore '{topic}': {path}")
+        log.info(f"{status} Vectorstore '{topic}': {path}")
     
     return vectorstores
 
-def create_sample_env_file(base_path: Path) -> bool:
+def create_sample_env_file(layout: Layout) -> bool:
     """
     Crea un archivo .env de ejemplo si no existe.
     
     Args:
-        base_path: Directorio base del proyecto
+        layout: Rutas del proyecto
         
     Returns:
         bool: True si se creó correctamente
     """
-    env_file = base_path / ".env"
+    env_file = layout.env_file
     
     if env_file.exists():
-        print(f"✓ Archivo .env ya existe: {env_file}")
+        log.info(f"✓ Archivo .env ya existe: {env_file}")
         return True
     
-    env_example = base_path / ".env.example"
+    env_example = layout.env_example
     if not env_example.exists():
-        print(f"✗ Archivo .env.example no encontrado")
+        log.info(f"✗ Archivo .env.example no encontrado")
         return False
     
     try:
-        # Copiar .env.example a .env
-        with open(env_example, 'r') as src, open(env_file, 'w') as dst:
-            content = src.read()
-            dst.write(content)
+        # Copiar .env.example a .env (copia en el kernel, sin decodificar)
+        shutil.copyfile(env_example, env_file)
         
-        print(f"✓ Archivo .env creado desde .env.example")
-        print(f"  → Revisa y ajusta la configuración en: {env_file}")
+        log.info(f"✓ Archivo .env creado desde .env.example")
+        log.info(f"  → Revisa y ajusta la configuración en: {env_file}")
         return True
         
     except Exception as e:
-        print(f"✗ Error creando archivo .env: {e}")
+        log.info(f"✗ Error creando archivo .env: {e}")
         return False
 
-def verify_configuration() -> Dict[str, Any]:
+def verify_configuration(settings: Optional["Settings"] = None) -> Optional["Settings"]:
     """
     Verifica la configuración actual.
     
+    Args:
+        settings: Configuración ya cargada (si no se indica, se carga aquí)
+        
     Returns:
-        Dict con información de configuración
+        La configuración verificada, o None si no es válida
     """
     try:
-        settings = get_settings()
+        if settings is None:
+            # Import diferido: arrastra pydantic y la configuración dinámica
+            from agentragmcp.core.config import get_settings
+            settings = get_settings()
         
-        config_status = {
-            "app_name": settings.APP_NAME,
-            "environment": settings.ENVIRONMENT,
-            "llm_model": settings.LLM_MODEL,
-            "llm_url": settings.LLM_BASE_URL,
-            "topics": settings.RAG_TOPICS,
-            "mcp_enabled": settings.MCP_ENABLED,
-            "valid": True
-        }
+        log.info("✓ Configuración cargada correctamente:")
+        log.info(f"  - Aplicación: {settings.APP_NAME} v{settings.APP_VERSION}")
+        log.info(f"  - Entorno: {settings.ENVIRONMENT}")
+        log.info(f"  - LLM: {settings.LLM_MODEL} @ {settings.LLM_BASE_URL}")
+        log.info(f"  - Temáticas RAG: {', '.join(settings.RAG_TOPICS)}")
+        log.info(f"  - MCP habilitado: {settings.MCP_ENABLED}")
         
-        print("✓ Configuración cargada correctamente:")
-        print(f"  - Aplicación: {settings.APP_NAME} v{settings.APP_VERSION}")
-        print(f"  - Entorno: {settings.ENVIRONMENT}")
-        print(f"  - LLM: {settings.LLM_MODEL} @ {settings.LLM_BASE_URL}")
-        print(f"  - Temáticas RAG: {', '.join(settings.RAG_TOPICS)}")
-        print(f"  - MCP habilitado: {settings.MCP_ENABLED}")
-        
-        return config_status
+        return settings
         
     except Exception as e:
-        print(f"✗ Error en configuración: {e}")
-        return {"valid": False, "error": str(e)}
+        log.info(f"✗ Error en configuración: {e}")
+        return None
+
+class _ThreadLogCapture(logging.Filter):
+    """
+    Filtro que, dentro de ``capture``, retiene los registros de cada hilo
+    para poder emitirlos luego en orden
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        records = getattr(self._local, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+    
+    def capture(self, func, *args):
+        """Ejecuta ``func`` y devuelve (resultado, registros capturados)"""
+        self._local.records = []
+        try:
+            return func(*args), self._local.records
+        finally:
+            self._local.records = None
 
-def run_health_checks() -> bool:
+def run_health_checks(settings) -> bool:
     """
     Ejecuta checks de salud básicos.
     
+    Args:
+        settings: Configuración de la aplicación
+        
     Returns:
         bool: True si todos los checks pasan
     """
-    print("\n=== HEALTH CHECKS ===")
+    log.info("\n=== HEALTH CHECKS ===")
     
     all_checks_passed = True
     
+    # Los tres checks son independientes: se lanzan a la vez y su salida se
+    # muestra después, en el orden habitual
+    capture = _ThreadLogCapture()
+    log.addFilter(capture)
+    try:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            config_future = executor.submit(capture.capture, verify_configuration, settings)
+            ollama_future = executor.submit(capture.capture, verify_ollama_connection, settings.LLM_BASE_URL)
+            vectorstores_future = executor.submit(capture.capture, check_vectorstores, settings)
+            
+            verified_settings, config_records = config_future.result()
+            ollama_ok, ollama_records = ollama_future.result()
+            vectorstores, vectorstores_records = vectorstores_future.result()
+    finally:
+        log.removeFilter(capture)
+    
     # Check 1: Configuración
-    config_status = verify_configuration()
-    if not config_status.get("valid", False):
+    for record in config_records:
+        log.handle(record)
+    if verified_settings is None:
         all_checks_passed = False
     
     # Check 2: Conexión Ollama
-    settings = get_settings()
-    ollama_ok = verify_ollama_connection(settings.LLM_BASE_URL)
+    for record in ollama_records:
+        log.handle(record)
     if not ollama_ok:
         all_checks_passed = False
     
     # Check 3: Vectorstores
-    vectorstores = check_vectorstores(settings)
+    for record in vectorstores_records:
+        log.handle(record)
     if not any(vectorstores.values()):
-        print("⚠️  Ningún vectorstore encontrado - necesitarás cargar datos")
+        log.info("⚠️  Ningún vectorstore encontrado - necesitarás cargar datos")
         # No marca como fallo porque es normal en primera instalación
     
     return all_checks_passed
@@ -233,92 +418,39 @@ def run_health_checks() -> bool:
 def check_dynamic_system():
     """Verifica que el sistema dinámico esté configurado"""
     config_path = Path("data/configs")
-    if not config_path.exists():
-        print("⚠️  Sistema dinámico no configurado. Ejecutar migración.")
+    if not _dir_has_entries(config_path):
+        log.info("⚠️  Sistema dinámico no configurado. Ejecutar migración.")
         return False
     return True
 
-def create_sample_data_info(base_path: Path) -> bool:
+def create_sample_data_info(layout: Layout) -> bool:
     """
     Crea información sobre cómo agregar datos de ejemplo.
     
     Args:
-        base_path: Directorio base del proyecto
+        layout: Rutas del proyecto
         
     Returns:
         bool: True si se creó correctamente
     """
-    data_dir = base_path / "data"
-    data_dir.mkdir(exist_ok=True)
+    readme_file = layout.data_readme
+    if readme_file.exists():
+        log.info(f"✓ Información sobre datos ya existe: {readme_file}")
+        return True
     
-    readme_content = """# Datos para AgentRagMCP
-
-## Estructura de Vectorstores
-
-Los vectorstores deben colocarse en:
-- `vectorstores/plants/` - Información general de plantas
-- `vectorstores/pathology/` - Patologías y enfermedades  
-- `vectorstores/general/` - Conocimiento general
-
-## Formato de Datos
-
-Los datos pueden estar en formato:
-- PDF
-- Texto plano (.txt)
-- Markdown (.md)
-- JSON estructurado
-
-## Creación de Vectorstores
-
-Para crear vectorstores desde documentos:
-
-```python
-from langchain_chroma import Chroma
-from langchain_ollama import OllamaEmbeddings
-from langchain_community.document_loaders import DirectoryLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-
-# Cargar documentos
-loader = DirectoryLoader("./docs/plants", glob="**/*.txt")
-documents = loader.load()
-
-# Dividir en chunks
-text_splitter = RecursiveCharacterTextSplitter(
-    chunk_size=1000,
-    chunk_overlap=200
-)
-chunks = text_splitter.split_documents(documents)
-
-# Crear embeddings
-embeddings = OllamaEmbeddings(model="hdnh2006/salamandra-7b-instruct:latest")
-
-# Crear vectorstore
-vectorstore = Chroma.from_documents(
-    documents=chunks,
-    embedding=embeddings,
-    persist_directory="./data/vectorstores/plants"
-)
-```
-
-## Fuentes de Datos Recomendadas
-
-- Manuales de agricultura y horticultura
-- Guías de identificación de plantas
-- Documentación científica sobre patologías
-- Enciclopedias botánicas
-- Artículos de divulgación científica
-"""
+    data_dir = layout.data
+    data_dir.mkdir(exist_ok=True)
     
     try:
-        readme_file = data_dir / "README.md"
-        with open(readme_file, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        # La plantilla solo se lee cuando realmente hay que escribirla; ya está
+        # en UTF-8, así que se copia en bytes sin pasar por la capa de texto
+        readme_file.write_bytes(DATA_README_TEMPLATE.read_bytes())
         
-        print(f"✓ Información sobre datos creada: {readme_file}")
+        log.info(f"✓ Información sobre datos creada: {readme_file}")
         return True
         
     except Exception as e:
-        print(f"✗ Error creando información de datos: {e}")
+        log.info(f"✗ Error creando información de datos: {e}")
         return False
 
 def main():
@@ -328,67 +460,79 @@ def main():
                        help="Saltar verificación de dependencias")
     parser.add_argument("--skip-ollama", action="store_true",
                        help="Saltar verificación de Ollama")
-    parser.add_argument("--verbose", "-v", action="store_true",
-                       help="Modo verbose")
+    parser.add_argument("--verbose", "-v", action="store_const",
+                       const=logging.DEBUG, default=logging.INFO,
+                       dest="log_level", help="Modo verbose")
     
     args = parser.parse_args()
     
-    if args.verbose:
-        logging.basicConfig(level=logging.DEBUG)
-    else:
-        logging.basicConfig(level=logging.INFO)
+    # El script no usa hilo ni proceso en sus logs: se desactiva su recogida
+    # para abaratar cada registro
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
-    print("🚀 Inicializando AgentRagMCP...\n")
+    logging.basicConfig(level=args.log_level)
+    
+    log.info("🚀 Inicializando AgentRagMCP...\n")
     
     # Obtener directorio base
-    base_path = Path(__file__).parent.parent
-    print(f"Directorio base: {base_path}\n")
+    layout = build_layout(root_dir)
+    log.info(f"Directorio base: {layout.base}\n")
+    flush_output()
     
     # Paso 1: Crear estructura de directorios
-    print("=== CREANDO ESTRUCTURA DE DIRECTORIOS ===")
-    if not setup_directories(base_path):
-        print("❌ Error creando directorios")
+    log.info("=== CREANDO ESTRUCTURA DE DIRECTORIOS ===")
+    if not setup_directories(layout):
+        log.error("❌ Error creando directorios")
         sys.exit(1)
+    flush_output()
     
     # Paso 2: Verificar dependencias
     if not args.skip_deps:
-        print("\n=== VERIFICANDO DEPENDENCIAS ===")
-        deps = check_dependencies()
-        missing_deps = [dep for dep, installed in deps.items() if not installed]
-        
-        if missing_deps:
-            print(f"\n❌ Dependencias faltantes: {', '.join(missing_deps)}")
-            print("Instálalas con: pip install -r config/requirements.txt")
+        log.info("\n=== VERIFICANDO DEPENDENCIAS ===")
+        if missing_deps := check_dependencies():
+            log.error(f"\n❌ Dependencias faltantes: {', '.join(missing_deps)}")
+            log.info("Instálalas con: pip install -r config/requirements.txt")
+            flush_output()
             sys.exit(1)
+        flush_output()
     
     # Paso 3: Crear archivo .env
-    print("\n=== CONFIGURANDO ARCHIVO .ENV ===")
-    if not create_sample_env_file(base_path):
-        print("⚠️  No se pudo crear archivo .env")
+    log.info("\n=== CONFIGURANDO ARCHIVO .ENV ===")
+    if not create_sample_env_file(layout):
+        log.info("⚠️  No se pudo crear archivo .env")
+    flush_output()
     
     # Paso 4: Verificar configuración
-    print("\n=== VERIFICANDO CONFIGURACIÓN ===")
-    if not verify_configuration():
-        print("❌ Error en configuración")
+    log.info("\n=== VERIFICANDO CONFIGURACIÓN ===")
+    # La configuración se carga una sola vez (tras crear el .env) y se reutiliza
+    settings = verify_configuration()
+    if settings is None:
+        log.error("❌ Error en configuración")
         sys.exit(1)
+    flush_output()
     
     # Paso 5: Health checks
-    if run_health_checks():
-        print("\n✅ Todos los health checks pasaron")
+    if run_health_checks(settings):
+        log.info("\n✅ Todos los health checks pasaron")
     else:
-        print("\n⚠️  Algunos health checks fallaron")
+        log.info("\n⚠️  Algunos health checks fallaron")
+    flush_output()
     
     # Paso 6: Crear información sobre datos
-    print("\n=== CREANDO INFORMACIÓN DE DATOS ===")
-    create_sample_data_info(base_path)
-    
-    print("\n🎉 Inicialización completada!")
-    print("\n📋 Próximos pasos:")
-    print("1. Ajusta la configuración en .env si es necesario")
-    print("2. Asegúrate de que Ollama esté corriendo con el modelo llama3.1")
-    print("3. Agrega documentos a los directorios de vectorstores")
-    print("4. Ejecuta la aplicación con: python -m agentragmcp.api.app.main")
-    print("\n📖 Documentación completa en: README.md")
+    log.info("\n=== CREANDO INFORMACIÓN DE DATOS ===")
+    create_sample_data_info(layout)
+    flush_output()
+    
+    log.info("\n🎉 Inicialización completada!")
+    log.info("\n📋 Próximos pasos:")
+    log.info("1. Ajusta la configuración en .env si es necesario")
+    log.info("2. Asegúrate de que Ollama esté corriendo con el modelo llama3.1")
+    log.info("3. Agrega documentos a los directorios de vectorstores")
+    log.info("4. Ejecuta la aplicación con: python -m agentragmcp.api.app.main")
+    log.info("\n📖 Documentación completa en: README.md")
+    flush_output()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
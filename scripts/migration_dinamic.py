@@ -4,13 +4,19 @@ Script de migración para convertir el sistema AgentRagMCP
 de configuración hardcodeada a sistema dinámico
 """
 
+import io
 import os
 import sys
-import yaml
-import json
-import shutil
+import threading
+import time
+import mmap
+import re
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 
 # Añadir el directorio raíz al path
 root_dir = Path(__file__).parent.parent
@@ -18,109 +24,263 @@ sys.path.insert(0, str(root_dir))
 
 from agentragmcp.core.dynamic_config import ConfigManager
 
-class AgentRagMCPMigrator:
-    """Migrador del sistema AgentRagMCP a configuración dinámica"""
+
+@functools.lru_cache(maxsize=None)
+def _yaml_backend() -> Tuple[Any, Any, Any]:
+    """
+    Importa yaml solo cuando se necesita por primera vez
     
-    def __init__(self, base_path: str = None):
-        self.base_path = Path(base_path) if base_path else Path.cwd()
-        self.config_manager = ConfigManager(str(self.base_path / "data" / "configs"))
-        
-        print(f"🔄 Iniciando migración en: {self.base_path}")
-        print(f"📍 Configuraciones en: {self.config_manager.config_base_path}")
+    Returns:
+        Tuple: Módulo yaml, Dumper y Loader (en C si libyaml está disponible)
+    """
+    import yaml
+    try:
+        from yaml import CSafeDumper as dumper, CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeDumper as dumper, SafeLoader as loader
+    return yaml, dumper, loader
+
+
+# Las rutas de escritura pueden llegar ya como str, sin construir objetos Path
+_PathLike = Union[str, Path]
+
+
+def _dump_yaml(data: Any, path: _PathLike) -> bool:
+    """
+    Serializa un diccionario de configuración a un archivo YAML
     
-    def migrate_full_system(self):
-        """Migra todo el sistema al nuevo formato"""
-        print("\n" + "="*60)
-        print("🚀 MIGRACIÓN COMPLETA A SISTEMA DINÁMICO")
-        print("="*60)
-        
-        steps = [
-            ("📁 Crear estructura de directorios", self.setup_directory_structure),
-            ("📋 Migrar configuraciones RAG", self.migrate_rag_configs),
-            ("🤖 Migrar configuraciones de agentes", self.migrate_agent_configs),
-            ("📚 Crear ejemplos personalizados", self.create_custom_examples),
-            ("🔄 Crear agentes personalizados", self.create_custom_agents),
-            ("✅ Validar migración", self.validate_migration),
-            ("🧪 Pruebas de funcionalidad", self.test_migration),
-            ("📖 Crear documentación", self.create_migration_docs),
-            ("🧹 Limpieza de archivos obsoletos", self.cleanup_old_files)
-        ]
+    Args:
+        data: Datos a serializar
+        path: Ruta del archivo de destino
         
-        for step_name, step_func in steps:
-            print(f"\n{step_name}...")
-            try:
-                step_func()
-                print(f"✅ {step_name} completado")
-            except Exception as e:
-                print(f"❌ Error en {step_name}: {e}")
-                raise
+    Returns:
+        bool: True si el archivo se escribió, False si ya estaba al día
+    """
+    # Se serializa a bytes en memoria y se escribe con una sola llamada,
+    # en vez de las muchas escrituras pequeñas del emisor sobre un archivo de texto
+    return _write_if_changed(path, _yaml_bytes(data))
+
+
+def _yaml_bytes(data: Any) -> bytes:
+    """Serializa datos a YAML codificado en UTF-8 (la codificación la hace el emisor)"""
+    yaml, dumper, _ = _yaml_backend()
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False,
+                     allow_unicode=True, encoding='utf-8')
+
+
+def _write_bytes(path: _PathLike, data: bytes):
+    """Escribe un buffer completo con open/write/close sin capa de texto"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _content_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# A partir de este tamaño el archivo existente se hashea mapeado en memoria
+_MMAP_DIGEST_THRESHOLD = 1 << 20
+
+
+def _file_digest(path: _PathLike, size: int) -> bytes:
+    """
+    Calcula el digest de un archivo existente sin cargarlo entero si es grande
+    
+    Args:
+        path: Ruta del archivo
+        size: Tamaño ya conocido del archivo
         
-        print(f"\n🎉 ¡Migración completada exitosamente!")
-        print(f"\n📋 Próximos pasos:")
-        print(f"   1. Verificar configuraciones en data/configs/")
-        print(f"   2. Añadir documentos a data/documents/")
-        print(f"   3. Ejecutar proceso de vectorización")
-        print(f"   4. Probar la aplicación")
+    Returns:
+        bytes: Digest blake2b del contenido
+    """
+    if size < _MMAP_DIGEST_THRESHOLD:
+        with open(path, 'rb') as f:
+            return _content_digest(f.read())
     
-    def setup_directory_structure(self):
-        """Crea la estructura de directorios para el sistema dinámico"""
-        directories = [
-            "data/configs/rags",
-            "data/configs/agents", 
-            "data/configs/custom",
-            "data/documents/plants",
-            "data/documents/pathology",
-            "data/documents/general",
-            "data/documents/eco_agriculture",
-            "data/documents/urban_gardening", 
-            "data/documents/permaculture",
-            "data/vectorstores/plants",
-            "data/vectorstores/pathology",
-            "data/vectorstores/general",
-            "data/vectorstores/eco_agriculture",
-            "data/vectorstores/urban_gardening",
-            "data/vectorstores/permaculture",
-            "agentragmcp/custom_agents",
-            "backups/migration"
-        ]
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _content_digest(mm)
+
+
+def _write_if_changed(path: _PathLike, data: bytes) -> bool:
+    """
+    Escribe el archivo solo si su contenido cambia
+    
+    Args:
+        path: Ruta del archivo de destino
+        data: Contenido completo ya serializado
         
-        for directory in directories:
-            dir_path = self.base_path / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
-            print(f"   📁 {directory}")
+    Returns:
+        bool: True si se escribió, False si el archivo existente es idéntico
+    """
+    try:
+        if (os.stat(path).st_size == len(data)
+                and _file_digest(path, len(data)) == _content_digest(data)):
+            return False
+    except FileNotFoundError:
+        pass
+    
+    # Escritura atómica: archivo temporal en el mismo directorio + os.replace
+    tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+    try:
+        _write_bytes(tmp_path, data)
+        os.replace(tmp_path, path)
+        _count_files.cache_clear()
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return True
+
+
+def _report_writes(results: List[Tuple[str, str, bool]], verbose: bool = True):
+    """
+    Muestra el resultado de escribir varios archivos generados
+    
+    Todas las líneas se vuelcan con una única escritura en stdout.
+    
+    Args:
+        results: Tuplas (icono, etiqueta, escrito) en el orden a mostrar
+        verbose: Una línea por archivo; si es False, solo un resumen
+    """
+    if not verbose and len(results) > 1:
+        written = sum(1 for _, _, was_written in results if was_written)
+        sys.stdout.write(f"   {results[0][0]} {written} archivos generados, "
+                         f"{len(results) - written} sin cambios\n")
+        return
+    
+    lines = [f"   {icon} {label}" if written else f"   ⏭️ {label} (sin cambios)"
+             for icon, label, written in results]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+class _BatchWriter:
+    """
+    Acumula escrituras (ruta, bytes) ya serializadas y las vuelca juntas.
+    
+    Todo se serializa antes de tocar el disco y las escrituras se reparten
+    en un pool de hilos, que liberan el GIL durante las llamadas al sistema.
+    """
+    
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._pending: List[Tuple[Path, bytes]] = []
+    
+    def add(self, path: _PathLike, data: bytes):
+        self._pending.append((path, data))
+    
+    def add_yaml(self, path: _PathLike, data: Any):
+        self.add(path, _yaml_bytes(data))
+    
+    def flush(self) -> List[bool]:
+        """
+        Escribe todos los archivos pendientes
         
-        # Crear archivo __init__.py para custom_agents
-        init_file = self.base_path / "agentragmcp" / "custom_agents" / "__init__.py"
-        if not init_file.exists():
-            init_file.write_text("# Custom agents module\n")
+        Returns:
+            List[bool]: Por cada archivo, en orden de llegada, si se escribió
+                (False si su contenido ya era idéntico)
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+            return list(pool.map(lambda item: _write_if_changed(*item), pending))
+
+
+# Plantillas de los documentos de ejemplo
+_EXAMPLE_DOCUMENTS_DIR = os.fspath(Path(__file__).parent / "templates" / "example_documents")
+# Temáticas que genera la migración (internadas: se usan como claves y en rutas)
+_MIGRATED_TOPICS = tuple(sys.intern(topic) for topic in (
+    "plants", "pathology", "general", "eco_agriculture", "urban_gardening"
+))
+
+# Documento de ejemplo i: _EXAMPLE_DOC_FILENAMES[i] en la temática _EXAMPLE_DOC_TOPICS[i]
+_EXAMPLE_DOC_TOPICS = _MIGRATED_TOPICS
+_EXAMPLE_DOC_FILENAMES = (
+    "manzano_cultivo.txt",
+    "enfermedades_manzano.txt",
+    "introduccion_botanica.txt",
+    "agricultura_ecologica_principios.txt",
+    "jardineria_urbana_basicos.txt"
+)
+# Documentación generada tras la migración
+_MIGRATION_README_TEMPLATE = Path(__file__).parent / "templates" / "migration_readme.md"
+# Configuración RAG personalizada de ejemplo
+_EXAMPLE_RAG_TEMPLATE = Path(__file__).parent / "templates" / "ejemplo_rag.yaml"
+
+# Literales compartidos por todas las configuraciones RAG, internados una vez
+_VS_TYPE = sys.intern("chroma")
+_EMB = sys.intern("llama3.1")
+_URL = sys.intern("http://localhost:11434")
+_SEARCH_TYPE = sys.intern("mmr")
+
+# Valores comunes a todas las configuraciones RAG (solo lectura)
+_DEFAULT_VECTORSTORE = MappingProxyType({
+    "type": _VS_TYPE,
+    "chunk_size": 1000,
+    "chunk_overlap": 200,
+    "embedding_model": _EMB,
+    "embedding_base_url": _URL
+})
+
+_DEFAULT_RETRIEVAL = MappingProxyType({
+    "search_type": _SEARCH_TYPE,
+    "k": 5,
+    "fetch_k": 20,
+    "lambda_mult": 0.7,
+    "score_threshold": 0.5
+})
+
+
+def _rag_config(topic: str, *, display_name: str, description: str, priority: int,
+                system_prompt: str, categories: List[str], keywords: Dict[str, List[str]],
+                custom_settings: Dict[str, Any], vectorstore: Optional[Dict[str, Any]] = None,
+                retrieval: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Construye la configuración de un RAG a partir de los valores por defecto
     
-    def migrate_rag_configs(self):
-        """Migra las configuraciones RAG hardcodeadas a archivos individuales"""
+    Args:
+        topic: Nombre de la temática (determina rutas y colección)
+        vectorstore: Valores del vectorstore que difieren de los por defecto
+        retrieval: Valores de recuperación que difieren de los por defecto
         
-        # Configuraciones RAG extraídas del código existente
-        rag_configs = {
-            "plants": {
-                "display_name": "Plantas y Botánica General",
-                "description": "Información general sobre plantas, cultivo, cuidados y botánica",
-                "enabled": True,
-                "priority": 1,
-                "vectorstore": {
-                    "type": "chroma",
-                    "path": "./data/vectorstores/plants",
-                    "collection_name": "plants_collection",
-                    "chunk_size": 1000,
-                    "chunk_overlap": 200,
-                    "embedding_model": "llama3.1",
-                    "embedding_base_url": "http://localhost:11434"
-                },
-                "retrieval": {
-                    "search_type": "mmr",
-                    "k": 5,
-                    "fetch_k": 20,
-                    "lambda_mult": 0.7,
-                    "score_threshold": 0.5
-                },
-                "system_prompt": """Eres un especialista en botánica y plantas.
+    Returns:
+        Diccionario de configuración listo para volcar a YAML
+    """
+    return {
+        "display_name": display_name,
+        "description": description,
+        "enabled": True,
+        "priority": priority,
+        "vectorstore": {
+            **_DEFAULT_VECTORSTORE,
+            "path": f"./data/vectorstores/{topic}",
+            "collection_name": f"{topic}_collection",
+            **(vectorstore or {})
+        },
+        "retrieval": {**_DEFAULT_RETRIEVAL, **(retrieval or {})},
+        "system_prompt": system_prompt,
+        "categories": categories,
+        "keywords": keywords,
+        "source_paths": [f"./data/documents/{topic}"],
+        "custom_settings": custom_settings
+    }
+
+
+# Configuraciones RAG extraídas del código existente
+_RAG_CONFIGS = {
+    "plants": _rag_config(
+        "plants",
+        display_name="Plantas y Botánica General",
+        description="Información general sobre plantas, cultivo, cuidados y botánica",
+        priority=1,
+        system_prompt="""Eres un especialista en botánica y plantas.
 
 **Especialidades principales:**
 - Información general sobre especies de plantas
@@ -132,40 +292,23 @@ class AgentRagMCPMigrator:
 **IMPORTANTE:** Enfócate en información práctica y aplicable.
 
 {context}""",
-                "categories": ["cultivo", "cuidados", "especies", "botánica"],
-                "keywords": {
-                    "primary": ["planta", "plantas", "árbol", "cultivo", "jardín", "botánica"],
-                    "secondary": ["sembrar", "plantar", "cuidar", "especie", "variedad"]
-                },
-                "source_paths": ["./data/documents/plants"],
-                "custom_settings": {
-                    "include_scientific_names": True,
-                    "focus_practical": True
-                }
-            },
-            
-            "pathology": {
-                "display_name": "Patologías y Enfermedades de Plantas",
-                "description": "Especialista en diagnóstico y tratamiento de enfermedades, plagas y patologías vegetales",
-                "enabled": True,
-                "priority": 2,
-                "vectorstore": {
-                    "type": "chroma",
-                    "path": "./data/vectorstores/pathology",
-                    "collection_name": "pathology_collection",
-                    "chunk_size": 1000,
-                    "chunk_overlap": 200,
-                    "embedding_model": "llama3.1",
-                    "embedding_base_url": "http://localhost:11434"
-                },
-                "retrieval": {
-                    "search_type": "mmr",
-                    "k": 5,
-                    "fetch_k": 20,
-                    "lambda_mult": 0.7,
-                    "score_threshold": 0.5
-                },
-                "system_prompt": """Eres un especialista en patologías vegetales y fitopatología.
+        categories=["cultivo", "cuidados", "especies", "botánica"],
+        keywords={
+            "primary": ["planta", "plantas", "árbol", "cultivo", "jardín", "botánica"],
+            "secondary": ["sembrar", "plantar", "cuidar", "especie", "variedad"]
+        },
+        custom_settings={
+            "include_scientific_names": True,
+            "focus_practical": True
+        }
+    ),
+    
+    "pathology": _rag_config(
+        "pathology",
+        display_name="Patologías y Enfermedades de Plantas",
+        description="Especialista en diagnóstico y tratamiento de enfermedades, plagas y patologías vegetales",
+        priority=2,
+        system_prompt="""Eres un especialista en patologías vegetales y fitopatología.
 
 **Especialidades principales:**
 - Diagnóstico de enfermedades de plantas
@@ -177,41 +320,24 @@ class AgentRagMCPMigrator:
 **IMPORTANTE:** Siempre incluye advertencias de seguridad para productos químicos.
 
 {context}""",
-                "categories": ["diagnóstico_enfermedades", "tratamientos", "prevención", "plagas"],
-                "keywords": {
-                    "primary": ["enfermedad", "plaga", "síntomas", "tratamiento", "hongo", "bacteria"],
-                    "secondary": ["patología", "virus", "prevención", "control", "insecticida"]
-                },
-                "source_paths": ["./data/documents/pathology"],
-                "custom_settings": {
-                    "safety_warnings": True,
-                    "treatment_focus": "integrated_pest_management",
-                    "include_prevention": True
-                }
-            },
-            
-            "general": {
-                "display_name": "Conocimiento General de Botánica",
-                "description": "Información educativa y divulgativa sobre el mundo vegetal",
-                "enabled": True,
-                "priority": 3,
-                "vectorstore": {
-                    "type": "chroma",
-                    "path": "./data/vectorstores/general",
-                    "collection_name": "general_collection",
-                    "chunk_size": 1000,
-                    "chunk_overlap": 200,
-                    "embedding_model": "llama3.1",
-                    "embedding_base_url": "http://localhost:11434"
-                },
-                "retrieval": {
-                    "search_type": "mmr",
-                    "k": 5,
-                    "fetch_k": 20,
-                    "lambda_mult": 0.7,
-                    "score_threshold": 0.5
-                },
-                "system_prompt": """Eres un educador especialista en botánica y ciencias vegetales.
+        categories=["diagnóstico_enfermedades", "tratamientos", "prevención", "plagas"],
+        keywords={
+            "primary": ["enfermedad", "plaga", "síntomas", "tratamiento", "hongo", "bacteria"],
+            "secondary": ["patología", "virus", "prevención", "control", "insecticida"]
+        },
+        custom_settings={
+            "safety_warnings": True,
+            "treatment_focus": "integrated_pest_management",
+            "include_prevention": True
+        }
+    ),
+    
+    "general": _rag_config(
+        "general",
+        display_name="Conocimiento General de Botánica",
+        description="Información educativa y divulgativa sobre el mundo vegetal",
+        priority=3,
+        system_prompt="""Eres un educador especialista en botánica y ciencias vegetales.
 
 **Especialidades principales:**
 - Conceptos fundamentales de botánica
@@ -223,81 +349,49 @@ class AgentRagMCPMigrator:
 **IMPORTANTE:** Explica conceptos de forma clara y educativa.
 
 {context}""",
-                "categories": ["educación", "conceptos", "historia", "biología_vegetal"],
-                "keywords": {
-                    "primary": ["qué es", "cómo funciona", "por qué", "botánica", "información"],
-                    "secondary": ["proceso", "concepto", "definición", "biología", "ciencia"]
-                },
-                "source_paths": ["./data/documents/general"],
-                "custom_settings": {
-                    "educational_focus": True,
-                    "include_examples": True
-                }
-            }
+        categories=["educación", "conceptos", "historia", "biología_vegetal"],
+        keywords={
+            "primary": ["qué es", "cómo funciona", "por qué", "botánica", "información"],
+            "secondary": ["proceso", "concepto", "definición", "biología", "ciencia"]
+        },
+        custom_settings={
+            "educational_focus": True,
+            "include_examples": True
         }
-        
-        # Crear configuraciones adicionales de ejemplo
-        rag_configs.update({
-            "eco_agriculture": {
-                "display_name": "Agricultura Ecológica",
-                "description": "Técnicas de agricultura sostenible y ecológica",
-                "enabled": True,
-                "priority": 4,
-                "vectorstore": {
-                    "type": "chroma",
-                    "path": "./data/vectorstores/eco_agriculture",
-                    "collection_name": "eco_agriculture_collection",
-                    "chunk_size": 1200,
-                    "chunk_overlap": 300,
-                    "embedding_model": "llama3.1",
-                    "embedding_base_url": "http://localhost:11434"
-                },
-                "retrieval": {
-                    "search_type": "mmr",
-                    "k": 6,
-                    "fetch_k": 20,
-                    "lambda_mult": 0.8,
-                    "score_threshold": 0.4
-                },
-                "system_prompt": """Eres un especialista en agricultura ecológica y sostenible.
+    ),
+    
+    # Configuraciones RAG adicionales de ejemplo
+    "eco_agriculture": _rag_config(
+        "eco_agriculture",
+        display_name="Agricultura Ecológica",
+        description="Técnicas de agricultura sostenible y ecológica",
+        priority=4,
+        vectorstore={"chunk_size": 1200, "chunk_overlap": 300},
+        retrieval={"k": 6, "lambda_mult": 0.8, "score_threshold": 0.4},
+        system_prompt="""Eres un especialista en agricultura ecológica y sostenible.
 
 Enfócate en técnicas respetuosas con el medio ambiente, biodiversidad y sostenibilidad.
 
 {context}""",
-                "categories": ["agricultura_ecológica", "sostenibilidad", "biodiversidad"],
-                "keywords": {
-                    "primary": ["ecológico", "sostenible", "biodiversidad", "orgánico"],
-                    "secondary": ["permacultura", "compost", "rotación", "natural"]
-                },
-                "source_paths": ["./data/documents/eco_agriculture"],
-                "custom_settings": {
-                    "certification_standards": ["EU_Organic", "USDA_Organic"],
-                    "focus_areas": ["soil_health", "biodiversity", "water_conservation"]
-                }
-            },
-            
-            "urban_gardening": {
-                "display_name": "Jardinería Urbana",
-                "description": "Cultivo en espacios urbanos, balcones y espacios reducidos",
-                "enabled": True,
-                "priority": 5,
-                "vectorstore": {
-                    "type": "chroma", 
-                    "path": "./data/vectorstores/urban_gardening",
-                    "collection_name": "urban_gardening_collection",
-                    "chunk_size": 800,
-                    "chunk_overlap": 150,
-                    "embedding_model": "llama3.1",
-                    "embedding_base_url": "http://localhost:11434"
-                },
-                "retrieval": {
-                    "search_type": "mmr",
-                    "k": 4,
-                    "fetch_k": 15,
-                    "lambda_mult": 0.6,
-                    "score_threshold": 0.5
-                },
-                "system_prompt": """Eres un especialista en jardinería urbana y cultivos en espacios reducidos.
+        categories=["agricultura_ecológica", "sostenibilidad", "biodiversidad"],
+        keywords={
+            "primary": ["ecológico", "sostenible", "biodiversidad", "orgánico"],
+            "secondary": ["permacultura", "compost", "rotación", "natural"]
+        },
+        custom_settings={
+            "certification_standards": ["EU_Organic", "USDA_Organic"],
+            "focus_areas": ["soil_health", "biodiversity", "water_conservation"]
+        }
+    ),
+    
+    "urban_gardening": _rag_config(
+        "urban_gardening",
+        display_name="Jardinería Urbana",
+        description="Cultivo en espacios urbanos, balcones y espacios reducidos",
+        priority=5,
+        vectorstore={"chunk_size": 800, "chunk_overlap": 150},
+        retrieval={"k": 4, "fetch_k": 15, "lambda_mult": 0.6},
+        system_prompt="""Eres un especialista en jardinería urbana y cultivos en espacios reducidos.
 
 **Especialidades:**
 - Cultivo en balcones y terrazas
@@ -306,475 +400,839 @@ Enfócate en técnicas respetuosas con el medio ambiente, biodiversidad y sosten
 - Aprovechamiento de espacios pequeños
 
 {context}""",
-                "categories": ["jardinería_urbana", "espacios_reducidos", "cultivo_interior"],
-                "keywords": {
-                    "primary": ["balcón", "terraza", "interior", "urbano", "maceta"],
-                    "secondary": ["apartamento", "espacio", "pequeño", "vertical"]
-                },
-                "source_paths": ["./data/documents/urban_gardening"],
-                "custom_settings": {
-                    "space_focus": "small_spaces",
-                    "container_gardening": True
-                }
+        categories=["jardinería_urbana", "espacios_reducidos", "cultivo_interior"],
+        keywords={
+            "primary": ["balcón", "terraza", "interior", "urbano", "maceta"],
+            "secondary": ["apartamento", "espacio", "pequeño", "vertical"]
+        },
+        custom_settings={
+            "space_focus": "small_spaces",
+            "container_gardening": True
+        }
+    )
+}
+
+# Especies objetivo de los agentes, definidas en un único sitio
+_TARGET_SPECIES = tuple(sys.intern(species) for species in (
+    "malus domestica", "prunus cerasus", "vitis vinifera",
+    "citrus aurantium", "prunus persica", "fragaria vesca",
+    "solanum lycopersicum"
+))
+# Subconjunto con patologías documentadas (nombre científico capitalizado)
+_PATHOLOGY_SPECIES = tuple(sys.intern(species) for species in (
+    "Malus domestica", "Vitis vinifera",
+    "Citrus aurantium", "Solanum lycopersicum"
+))
+
+# Configuración de agentes (incluye los agentes personalizados de ejemplo)
+_AGENTS_CONFIG = {
+    "agents": {
+        "plants": {
+            "name": "plants",
+            "description": "Especialista en información general de plantas, cultivo y botánica",
+            "class": "PlantsAgent",
+            "topics": ["plants"],
+            "enabled": True,
+            "priority": 1,
+            "config": {
+                "max_confidence": 1.0,
+                "min_confidence": 0.1,
+                "fallback_enabled": False,
+                "primary_keywords": [
+                    "planta", "plantas", "árbol", "árboles", "cultivo", "cultivar",
+                    "sembrar", "plantar", "jardín", "huerto", "botánica"
+                ],
+                "patterns": [
+                    "cómo.*cultivar", "cuándo.*plantar", "qué.*planta",
+                    "características.*de", "cuidados.*de", "información.*sobre"
+                ],
+                "target_species": list(_TARGET_SPECIES)
+            },
+            "thresholds": {
+                "keyword_weight": 0.3,
+                "species_weight": 0.5,
+                "pattern_weight": 0.2,
+                "context_bonus": 0.2
             }
-        })
+        },
         
-        # Guardar configuraciones
-        rags_path = self.config_manager.config_base_path / "rags"
-        
-        for topic_name, config_data in rag_configs.items():
-            config_file = rags_path / f"{topic_name}.yaml"
-            with open(config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
-            print(f"   📋 {topic_name}.yaml")
-    
-    def migrate_agent_configs(self):
-        """Migra las configuraciones de agentes hardcodeadas"""
-        
-        agents_config = {
-            "agents": {
-                "plants": {
-                    "name": "plants",
-                    "description": "Especialista en información general de plantas, cultivo y botánica",
-                    "class": "PlantsAgent",
-                    "topics": ["plants"],
-                    "enabled": True,
-                    "priority": 1,
-                    "config": {
-                        "max_confidence": 1.0,
-                        "min_confidence": 0.1,
-                        "fallback_enabled": False,
-                        "primary_keywords": [
-                            "planta", "plantas", "árbol", "árboles", "cultivo", "cultivar",
-                            "sembrar", "plantar", "jardín", "huerto", "botánica"
-                        ],
-                        "patterns": [
-                            "cómo.*cultivar", "cuándo.*plantar", "qué.*planta",
-                            "características.*de", "cuidados.*de", "información.*sobre"
-                        ],
-                        "target_species": [
-                            "malus domestica", "prunus cerasus", "vitis vinifera",
-                            "citrus aurantium", "prunus persica", "fragaria vesca",
-                            "solanum lycopersicum"
-                        ]
-                    },
-                    "thresholds": {
-                        "keyword_weight": 0.3,
-                        "species_weight": 0.5,
-                        "pattern_weight": 0.2,
-                        "context_bonus": 0.2
-                    }
-                },
-                
-                "pathology": {
-                    "name": "pathology",
-                    "description": "Especialista en patologías, enfermedades, plagas y tratamientos de plantas",
-                    "class": "PathologyAgent",
-                    "topics": ["pathology"],
-                    "enabled": True,
-                    "priority": 2,
-                    "config": {
-                        "max_confidence": 1.0,
-                        "min_confidence": 0.1,
-                        "fallback_enabled": False,
-                        "primary_keywords": [
-                            "enfermedad", "enfermedades", "patología", "patologías",
-                            "plaga", "plagas", "hongo", "hongos", "bacteria", "bacterias",
-                            "virus", "tratamiento", "síntomas", "control"
-                        ],
-                        "symptom_keywords": [
-                            "mancha", "manchas", "amarilleo", "marchitez", "podredumbre",
-                            "necrosis", "lesión", "deformación"
-                        ],
-                        "patterns": [
-                            "qué.*enfermedad", "cómo.*tratar", "síntomas.*de",
-                            "problema.*con", "se.*está.*muriendo", "hojas.*amarillas"
-                        ],
-                        "target_species": [
-                            "Malus domestica", "Vitis vinifera", 
-                            "Citrus aurantium", "Solanum lycopersicum"
-                        ]
-                    },
-                    "thresholds": {
-                        "keyword_weight": 0.5,
-                        "symptom_weight": 0.3,
-                        "species_weight": 0.3,
-                        "pattern_weight": 0.4
-                    }
-                },
-                
-                "general": {
-                    "name": "general",
-                    "description": "Asistente general para consultas diversas sobre plantas y botánica",
-                    "class": "GeneralAgent",
-                    "topics": ["general"],
-                    "enabled": True,
-                    "priority": 3,
-                    "config": {
-                        "max_confidence": 0.8,
-                        "min_confidence": 0.1,
-                        "fallback_enabled": True,
-                        "primary_keywords": [
-                            "qué es", "qué son", "cómo funciona", "por qué",
-                            "explicar", "definir", "botánica", "información"
-                        ],
-                        "patterns": [
-                            "qué.*es.*la?", "cómo.*funciona", "por.*qué.*las?.*plantas",
-                            "diferencia.*entre", "tipos.*de", "explicar.*qué"
-                        ],
-                        "educational_focus": True
-                    },
-                    "thresholds": {
-                        "keyword_weight": 0.4,
-                        "pattern_weight": 0.3,
-                        "educational_bonus": 0.3
-                    }
-                },
-                
-                # Agentes personalizados de ejemplo
-                "eco_agriculture": {
-                    "name": "eco_agriculture",
-                    "description": "Especialista en agricultura ecológica y sostenible",
-                    "class": "EcoAgricultureAgent",
-                    "topics": ["eco_agriculture"],
-                    "enabled": True,
-                    "priority": 4,
-                    "config": {
-                        "max_confidence": 1.0,
-                        "min_confidence": 0.1,
-                        "primary_keywords": [
-                            "ecológico", "orgánico", "sostenible", "biodiversidad",
-                            "permacultura", "compost", "rotación"
-                        ],
-                        "patterns": [
-                            "agricultura.*ecológica", "cultivo.*orgánico", ".*sostenible"
-                        ],
-                        "focus_areas": ["soil_health", "biodiversity", "sustainability"]
-                    },
-                    "thresholds": {
-                        "keyword_weight": 0.6,
-                        "pattern_weight": 0.4
-                    }
-                },
-                
-                "urban_gardening": {
-                    "name": "urban_gardening",
-                    "description": "Especialista en jardinería urbana y cultivos en espacios reducidos",
-                    "class": "UrbanGardeningAgent",
-                    "topics": ["urban_gardening"],
-                    "enabled": True,
-                    "priority": 5,
-                    "config": {
-                        "max_confidence": 1.0,
-                        "min_confidence": 0.1,
-                        "primary_keywords": [
-                            "balcón", "terraza", "interior", "urbano", "maceta",
-                            "apartamento", "espacio", "pequeño"
-                        ],
-                        "patterns": [
-                            "en.*balcón", "en.*terraza", "espacio.*pequeño", ".*interior"
-                        ],
-                        "space_types": ["balcony", "terrace", "indoor", "small_space"]
-                    },
-                    "thresholds": {
-                        "keyword_weight": 0.5,
-                        "pattern_weight": 0.3,
-                        "space_bonus": 0.2
-                    }
-                }
+        "pathology": {
+            "name": "pathology",
+            "description": "Especialista en patologías, enfermedades, plagas y tratamientos de plantas",
+            "class": "PathologyAgent",
+            "topics": ["pathology"],
+            "enabled": True,
+            "priority": 2,
+            "config": {
+                "max_confidence": 1.0,
+                "min_confidence": 0.1,
+                "fallback_enabled": False,
+                "primary_keywords": [
+                    "enfermedad", "enfermedades", "patología", "patologías",
+                    "plaga", "plagas", "hongo", "hongos", "bacteria", "bacterias",
+                    "virus", "tratamiento", "síntomas", "control"
+                ],
+                "symptom_keywords": [
+                    "mancha", "manchas", "amarilleo", "marchitez", "podredumbre",
+                    "necrosis", "lesión", "deformación"
+                ],
+                "patterns": [
+                    "qué.*enfermedad", "cómo.*tratar", "síntomas.*de",
+                    "problema.*con", "se.*está.*muriendo", "hojas.*amarillas"
+                ],
+                "target_species": list(_PATHOLOGY_SPECIES)
+            },
+            "thresholds": {
+                "keyword_weight": 0.5,
+                "symptom_weight": 0.3,
+                "species_weight": 0.3,
+                "pattern_weight": 0.4
             }
-        }
-        
-        # Guardar configuración de agentes
-        agents_file = self.config_manager.config_base_path / "agents.yaml"
-        with open(agents_file, 'w', encoding='utf-8') as f:
-            yaml.dump(agents_config, f, default_flow_style=False, allow_unicode=True)
+        },
         
-        print(f"   🤖 agents.yaml con {len(agents_config['agents'])} agentes")
-    
-    def create_custom_examples(self):
-        """Crea ejemplos de documentos para cada temática"""
+        "general": {
+            "name": "general",
+            "description": "Asistente general para consultas diversas sobre plantas y botánica",
+            "class": "GeneralAgent",
+            "topics": ["general"],
+            "enabled": True,
+            "priority": 3,
+            "config": {
+                "max_confidence": 0.8,
+                "min_confidence": 0.1,
+                "fallback_enabled": True,
+                "primary_keywords": [
+                    "qué es", "qué son", "cómo funciona", "por qué",
+                    "explicar", "definir", "botánica", "información"
+                ],
+                "patterns": [
+                    "qué.*es.*la?", "cómo.*funciona", "por.*qué.*las?.*plantas",
+                    "diferencia.*entre", "tipos.*de", "explicar.*qué"
+                ],
+                "educational_focus": True
+            },
+            "thresholds": {
+                "keyword_weight": 0.4,
+                "pattern_weight": 0.3,
+                "educational_bonus": 0.3
+            }
+        },
         
-        # Documento para plantas
-        plants_doc = """# Cultivo del Manzano (Malus domestica)
-
-## Características Generales
-El manzano es un árbol frutal de la familia Rosaceae, originario de Asia Central.
-
-## Condiciones de Cultivo
-- **Clima**: Templado, con inviernos fríos
-- **Suelo**: Bien drenado, pH 6.0-7.0
-- **Exposición**: Pleno sol
-
-## Cuidados Específicos
-### Riego
-- Riego regular pero sin encharcamiento
-- Especialmente importante durante la fructificación
-
-### Poda
-- Poda de formación en invierno
-- Eliminar ramas secas y entrecruzadas
-
-## Variedades Recomendadas
-- Golden Delicious
-- Red Delicious
-- Granny Smith
-"""
+        # Agentes personalizados de ejemplo
+        "eco_agriculture": {
+            "name": "eco_agriculture",
+            "description": "Especialista en agricultura ecológica y sostenible",
+            "class": "EcoAgricultureAgent",
+            "topics": ["eco_agriculture"],
+            "enabled": True,
+            "priority": 4,
+            "config": {
+                "max_confidence": 1.0,
+                "min_confidence": 0.1,
+                "primary_keywords": [
+                    "ecológico", "orgánico", "sostenible", "biodiversidad",
+                    "permacultura", "compost", "rotación"
+                ],
+                "patterns": [
+                    "agricultura.*ecológica", "cultivo.*orgánico", ".*sostenible"
+                ],
+                "focus_areas": ["soil_health", "biodiversity", "sustainability"]
+            },
+            "thresholds": {
+                "keyword_weight": 0.6,
+                "pattern_weight": 0.4
+            }
+        },
         
-        # Documento para patologías
-        pathology_doc = """# Enfermedades Comunes del Manzano
-
-## Mildiu Polvoriento
-### Síntomas
-- Polvo blanco en hojas y brotes jóvenes
-- Deformación de hojas
-- Reducción del crecimiento
-
-### Tratamiento
-- Aplicar fungicidas sistémicos
-- Mejorar ventilación
-- Eliminar partes afectadas
-
-### Prevención
-- Evitar riego por aspersión
-- Plantar variedades resistentes
-
-## Fuego Bacteriano
-### Síntomas
-- Marchitez súbita de flores y brotes
-- Exudado bacteriano
-- Necrosis progresiva
-
-### Tratamiento
-- Eliminación inmediata de partes afectadas
-- Desinfección de herramientas
-- Aplicación de antibióticos específicos
-
-⚠️ **Advertencia**: Siempre usar equipo de protección personal.
-"""
-
-        # Documento general
-        general_doc = """# Introducción a la Botánica
-
-## ¿Qué es la Botánica?
-La botánica es la ciencia que estudia las plantas en todos sus aspectos.
-
-## Clasificación de las Plantas
-### Por su estructura
-- **Briófitos**: Musgos y hepáticas
-- **Pteridófitos**: Helechos
-- **Gimnospermas**: Coníferas
-- **Angiospermas**: Plantas con flores
-
-### Por su ciclo de vida
-- **Anuales**: Completan su ciclo en un año
-- **Bianuales**: Requieren dos años
-- **Perennes**: Viven varios años
-
-## Procesos Fundamentales
-### Fotosíntesis
-Proceso mediante el cual las plantas convierten luz solar en energía química.
-
-### Respiración
-Las plantas también respiran, consumiendo oxígeno y liberando CO2.
-"""
+        "urban_gardening": {
+            "name": "urban_gardening",
+            "description": "Especialista en jardinería urbana y cultivos en espacios reducidos",
+            "class": "UrbanGardeningAgent",
+            "topics": ["urban_gardening"],
+            "enabled": True,
+            "priority": 5,
+            "config": {
+                "max_confidence": 1.0,
+                "min_confidence": 0.1,
+                "primary_keywords": [
+                    "balcón", "terraza", "interior", "urbano", "maceta",
+                    "apartamento", "espacio", "pequeño"
+                ],
+                "patterns": [
+                    "en.*balcón", "en.*terraza", "espacio.*pequeño", ".*interior"
+                ],
+                "space_types": ["balcony", "terrace", "indoor", "small_space"]
+            },
+            "thresholds": {
+                "keyword_weight": 0.5,
+                "pattern_weight": 0.3,
+                "space_bonus": 0.2
+            }
+        }
+    }
+}
 
-        # Documento agricultura ecológica
-        eco_doc = """# Principios de la Agricultura Ecológica
-
-## Filosofía de Base
-La agricultura ecológica busca trabajar en armonía con la naturaleza.
-
-## Principios Fundamentales
-1. **Salud del suelo**: Base de todo sistema sostenible
-2. **Biodiversidad**: Promover la diversidad biológica
-3. **Ciclos naturales**: Respetar los ritmos de la naturaleza
-4. **Bienestar animal**: Garantizar condiciones naturales
-
-## Técnicas Principales
-### Compostaje
-- Transformación de residuos orgánicos
-- Mejora la estructura del suelo
-- Aporta nutrientes naturales
-
-### Rotación de Cultivos
-- Previene agotamiento del suelo
-- Reduce plagas y enfermedades
-- Optimiza uso de nutrientes
-
-### Control Biológico
-- Uso de enemigos naturales
-- Plantas companion
-- Preparados biodinámicos
-"""
-
-        # Documento jardinería urbana
-        urban_doc = """# Jardinería en Espacios Urbanos
-
-## Desafíos de la Ciudad
-- Espacio limitado
-- Calidad del aire
-- Acceso limitado a luz solar
-- Restricciones de peso en balcones
-
-## Soluciones Prácticas
-### Cultivo Vertical
-- Aprovechar paredes y estructuras
-- Sistemas de trepado
-- Jardines verticales modulares
-
-### Contenedores y Macetas
-- Selección según espacio disponible
-- Sistemas de drenaje adecuados
-- Movilidad para optimizar luz
-
-## Plantas Recomendadas
-### Para balcones
-- Hierbas aromáticas: albahaca, perejil, cilantro
-- Tomates cherry
-- Fresas
-
-### Para interiores
-- Pothos
-- Sansevieria
-- Plantas aromáticas
-
-## Sistemas de Riego
-- Riego por goteo automático
-- Sistemas de autorriego con reserva de agua
-- Aplicaciones móviles para control de humedad
-"""
-        
-        # Guardar documentos
-        documents = [
-            ("plants", "manzano_cultivo.txt", plants_doc),
-            ("pathology", "enfermedades_manzano.txt", pathology_doc), 
-            ("general", "introduccion_botanica.txt", general_doc),
-            ("eco_agriculture", "agricultura_ecologica_principios.txt", eco_doc),
-            ("urban_gardening", "jardineria_urbana_basicos.txt", urban_doc)
-        ]
-        
-        for topic, filename, content in documents:
-            doc_path = self.base_path / "data" / "documents" / topic / filename
-            with open(doc_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"   📄 {topic}/{filename}")
-    
-    def create_custom_agents(self):
-        """Crea agentes personalizados de ejemplo"""
-        
-        # Agente de agricultura ecológica
-        eco_agent_code = '''"""
-Agente especializado en agricultura ecológica y sostenible
+# Plantilla común de los agentes personalizados de ejemplo
+_AGENT_TEMPLATE = '''"""
+Agente especializado en {module_doc}
 """
 
+import re
 from typing import List, Optional, Dict, Any
 from agentragmcp.api.app.agents.dinamic_agent import DynamicAgent
 
-class EcoAgricultureAgent(DynamicAgent):
-    """Agente especializado en agricultura ecológica"""
+# Términos que activan la nota adicional, fusionados en una sola expresión
+_TRIGGER_RE = re.compile(r"{trigger_pattern}")
+
+class {class_name}(DynamicAgent):
+    """Agente especializado en {class_doc}"""
+    
+    # Términos que suman confianza, construidos una sola vez por clase
+    {terms_const} = frozenset({{
+        {terms}
+    }})
     
     def __init__(self, config: Dict[str, Any], rag_service):
-        super().__init__("eco_agriculture", config, rag_service)
-        self.focus_areas = config.get("focus_areas", [])
+        super().__init__("{topic}", config, rag_service)
+        self.{extra_key} = config.get("{extra_key}", [])
     
     def calculate_confidence(self, question: str) -> float:
-        """Calcula confianza específica para agricultura ecológica"""
+        """Calcula confianza específica para {class_doc}"""
         confidence = super().calculate_confidence(question)
         
-        # Bonus por términos específicos de agricultura ecológica
-        eco_terms = [
-            "ecológico", "orgánico", "sostenible", "biodiversidad",
-            "permacultura", "compost", "rotación", "natural"
-        ]
-        
+        # {bonus_comment}
         question_lower = question.lower()
-        eco_matches = sum(1 for term in eco_terms if term in question_lower)
+        {prefix}_matches = sum(1 for term in self.{terms_const} if term in question_lower)
         
-        if eco_matches > 0:
-            eco_bonus = min(eco_matches * 0.2, 0.4)
-            confidence += eco_bonus
+        if {prefix}_matches > 0:
+            {bonus_var} = min({prefix}_matches * {bonus_step}, {bonus_cap})
+            confidence += {bonus_var}
         
         return min(confidence, 1.0)
     
     def enhance_response(self, response: str, question: str) -> str:
-        """Mejora la respuesta con enfoque ecológico"""
+        """Mejora la respuesta con enfoque {focus}"""
         enhanced = response
+        question_lower = question.lower()
         
-        # Añadir consideraciones ecológicas
-        if any(term in question.lower() for term in ["tratamiento", "control", "plaga"]):
-            enhanced += "\\n\\n🌱 **Enfoque Ecológico**: Considera siempre alternativas naturales y sostenibles."
+        # {enhance_comment}
+        if _TRIGGER_RE.search(question_lower):
+            enhanced += "\\n\\n{trigger_note}"
         
-        if "cultivo" in question.lower():
-            enhanced += "\\n\\n♻️ **Sostenibilidad**: Recuerda mantener la salud del suelo y la biodiversidad."
+        if "{keyword}" in question_lower:
+            enhanced += "\\n\\n{keyword_note}"
         
         return enhanced
 '''
 
-        # Agente de jardinería urbana  
-        urban_agent_code = '''"""
-Agente especializado en jardinería urbana y espacios reducidos
-"""
+def _render_agent(spec: Dict[str, Any]) -> bytes:
+    """
+    Genera el código fuente de un agente personalizado
+    
+    Args:
+        spec: Valores de la plantilla del agente
+        
+    Returns:
+        bytes: Código fuente codificado en UTF-8
+    """
+    trigger_pattern = "|".join(re.escape(term) for term in spec["trigger_terms"])
+    return _AGENT_TEMPLATE.format_map({**spec, "trigger_pattern": trigger_pattern}).encode('utf-8')
+
+
+# Parámetros de cada agente personalizado: (archivo, valores de la plantilla)
+_CUSTOM_AGENT_SPECS = (
+    ("eco_agriculture_agent.py", {
+        "module_doc": "agricultura ecológica y sostenible",
+        "class_name": "EcoAgricultureAgent",
+        "class_doc": "agricultura ecológica",
+        "topic": "eco_agriculture",
+        "extra_key": "focus_areas",
+        "bonus_comment": "Bonus por términos específicos de agricultura ecológica",
+        "prefix": "eco",
+        "terms_const": "ECO_TERMS",
+        "terms": '"ecológico", "orgánico", "sostenible", "biodiversidad",\n'
+                 '        "permacultura", "compost", "rotación", "natural"',
+        "bonus_var": "eco_bonus",
+        "bonus_step": "0.2",
+        "bonus_cap": "0.4",
+        "focus": "ecológico",
+        "enhance_comment": "Añadir consideraciones ecológicas",
+        "trigger_terms": ("tratamiento", "control", "plaga"),
+        "trigger_note": "🌱 **Enfoque Ecológico**: Considera siempre alternativas naturales y sostenibles.",
+        "keyword": "cultivo",
+        "keyword_note": "♻️ **Sostenibilidad**: Recuerda mantener la salud del suelo y la biodiversidad.",
+    }),
+    ("urban_gardening_agent.py", {
+        "module_doc": "jardinería urbana y espacios reducidos",
+        "class_name": "UrbanGardeningAgent",
+        "class_doc": "jardinería urbana",
+        "topic": "urban_gardening",
+        "extra_key": "space_types",
+        "bonus_comment": "Bonus por términos de espacios urbanos",
+        "prefix": "urban",
+        "terms_const": "URBAN_TERMS",
+        "terms": '"balcón", "terraza", "interior", "urbano", "maceta",\n'
+                 '        "apartamento", "espacio pequeño", "vertical"',
+        "bonus_var": "space_bonus",
+        "bonus_step": "0.15",
+        "bonus_cap": "0.3",
+        "focus": "urbano",
+        "enhance_comment": "Añadir consideraciones de espacio",
+        "trigger_terms": ("cultivar", "plantar"),
+        "trigger_note": "🏙️ **Adaptación Urbana**: Considera las limitaciones de espacio y contenedores.",
+        "keyword": "riego",
+        "keyword_note": "💧 **Riego Urbano**: Sistemas de autorriego son ideales para balcones.",
+    }),
+)
+
+
+def _count_mapping_entries(path: _PathLike, key: str) -> int:
+    """
+    Cuenta las entradas del mapping asociado a una clave de primer nivel
+    
+    Recorre los eventos del parser sin construir objetos Python, de modo que
+    las configuraciones anidadas de cada entrada nunca llegan a materializarse.
+    
+    Args:
+        path: Archivo YAML
+        key: Clave de primer nivel (p. ej. "agents")
+        
+    Returns:
+        int: Número de entradas, o 0 si la clave no existe o no es un mapping
+    """
+    yaml, _, loader = _yaml_backend()
+    node_events = (yaml.ScalarEvent, yaml.AliasEvent,
+                   yaml.MappingStartEvent, yaml.SequenceStartEvent)
+    counters: List[int] = []   # nodos vistos en cada colección abierta
+    target_index = None        # posición del valor de `key` en el mapping raíz
+    
+    with open(path, 'rb') as f:
+        for event in yaml.parse(f, Loader=loader):
+            if isinstance(event, node_events) and counters:
+                index = counters[-1]
+                counters[-1] += 1
+                if (len(counters) == 1 and index % 2 == 0
+                        and isinstance(event, yaml.ScalarEvent) and event.value == key):
+                    target_index = index + 1
+                elif len(counters) == 1 and index == target_index:
+                    if not isinstance(event, yaml.MappingStartEvent):
+                        return 0
+            
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                counters.append(0)
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                inner = counters.pop()
+                if len(counters) == 1 and target_index is not None and counters[0] == target_index + 1:
+                    # Claves y valores alternan: la mitad de los nodos son claves
+                    return inner // 2
+                if not counters:
+                    break
+    return 0
+
+
+# Versión de los recuentos guardados en la caché de validación; subirla cuando
+# cambie la forma de contar para no reutilizar resultados antiguos
+_VALIDATION_CACHE_VERSION = 2
+
+
+# Bloque "agents:" en estilo de bloque (como lo emite _dump_yaml), sus líneas
+# indentadas con exactamente dos espacios y las que son claves simples
+# (texto plano sin ":" o entre comillas, seguido de ": " o fin de línea)
+_AGENTS_BLOCK_RE = re.compile(rb'^agents:[ \t]*\r?\n((?:[ \t].*(?:\n|\Z)|\r?\n)*)', re.MULTILINE)
+_AGENT_ENTRY_RE = re.compile(rb'^  [^ \t\r\n#]', re.MULTILINE)
+_AGENT_KEY_RE = re.compile(
+    rb'^  (?:"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\n]|\'\')*\'|[^ \t\r\n#\'"\-?:\[\]{},&*!|>%@`][^:\n]*?)'
+    rb':(?:[ \t]|\r?$)', re.MULTILINE)
+
+
+def _count_agents(path: _PathLike) -> int:
+    """
+    Cuenta los agentes definidos en agents.yaml
+    
+    Vía rápida: busca el bloque agents: sobre un mmap del archivo y cuenta sus
+    claves con una expresión regular, sin pasar por el parser. El resultado
+    solo se acepta si todas las líneas de primer nivel del bloque son claves
+    reconocidas; en cualquier otro caso (estilo flujo, otra indentación,
+    claves complejas, archivo vacío...) se recurre a _count_mapping_entries.
+    
+    Args:
+        path: Ruta de agents.yaml
+        
+    Returns:
+        int: Número de agentes
+    """
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _AGENTS_BLOCK_RE.search(mm)
+            if match:
+                block = match.group(1)
+                count = len(_AGENT_KEY_RE.findall(block))
+                if count and count == len(_AGENT_ENTRY_RE.findall(block)):
+                    return count
+    except ValueError:
+        # mmap no admite archivos vacíos
+        pass
+    return _count_mapping_entries(path, "agents")
+
+
+@functools.lru_cache(maxsize=256)
+def _count_files(dirpath: str, suffix: str, exclude: Tuple[str, ...] = ()) -> int:
+    """
+    Cuenta los archivos de un directorio con una extensión dada
+    
+    Una sola pasada de os.scandir cuyo tipo de entrada ya viene en el propio
+    dirent. A diferencia de Path.glob, se ignoran a propósito las entradas
+    ocultas, como los temporales .<nombre>.tmp que _write_if_changed crea
+    mientras escribe.
+    El resultado se memoriza; _write_if_changed invalida la caché al escribir
+    y validate_migration cuando detecta cambios hechos fuera del proceso.
+    
+    Args:
+        dirpath: Directorio a inspeccionar
+        suffix: Extensión buscada, p. ej. ".yaml"
+        exclude: Nombres de archivo a ignorar
+        
+    Returns:
+        int: Número de archivos encontrados
+    """
+    with os.scandir(dirpath) as entries:
+        return sum(1 for entry in entries
+                   if entry.name.endswith(suffix)
+                   and not entry.name.startswith(".")
+                   and entry.name not in exclude
+                   and entry.is_file())
+
+
+class _ThreadStdout:
+    """
+    Sustituto de sys.stdout que desvía la salida de cada hilo a su propio buffer.
+    
+    Permite ejecutar pasos en paralelo y mostrar después su salida completa,
+    paso a paso y en orden, sin líneas intercaladas.
+    """
+    
+    def __init__(self, target):
+        self.target = target
+        self._local = threading.local()
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self.target).write(text)
+    
+    def flush(self):
+        self.target.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+    
+    def run(self, func: Callable[[], Any]) -> Tuple[Optional[Exception], str]:
+        """
+        Ejecuta func capturando lo que imprime el hilo actual
+        
+        Returns:
+            Tuple[Optional[Exception], str]: Error producido (o None) y salida capturada
+        """
+        self._local.buffer = io.StringIO()
+        try:
+            func()
+            return None, self._local.buffer.getvalue()
+        except Exception as e:
+            return e, self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
 
-from typing import List, Optional, Dict, Any
-from agentragmcp.api.app.agents.dinamic_agent import DynamicAgent
 
-class UrbanGardeningAgent(DynamicAgent):
-    """Agente especializado en jardinería urbana"""
+@functools.lru_cache(maxsize=None)
+def _get_config_manager(config_path: str) -> ConfigManager:
+    """Devuelve un ConfigManager compartido por ruta de configuración"""
+    return ConfigManager(config_path)
+
+
+class AgentRagMCPMigrator:
+    """Migrador del sistema AgentRagMCP a configuración dinámica"""
     
-    def __init__(self, config: Dict[str, Any], rag_service):
-        super().__init__("urban_gardening", config, rag_service)
-        self.space_types = config.get("space_types", [])
+    def __init__(self, base_path: str = None, verbose: bool = True):
+        self.base_path = Path(base_path) if base_path else Path.cwd()
+        # Con verbose=False los pasos muestran resúmenes en vez de un listado por archivo
+        self.verbose = verbose
+        self.config_manager = _get_config_manager(str(self.base_path / "data" / "configs"))
+        # Recuentos de lo generado por cada paso, reutilizables en la validación
+        self._step_counts: Dict[str, int] = {}
+        
+        print(f"🔄 Iniciando migración en: {self.base_path}")
+        print(f"📍 Configuraciones en: {self.config_manager.config_base_path}")
     
-    def calculate_confidence(self, question: str) -> float:
-        """Calcula confianza específica para jardinería urbana"""
-        confidence = super().calculate_confidence(question)
+    # Rutas de trabajo, resueltas una sola vez como str
+    
+    @functools.cached_property
+    def _configs_dir(self) -> str:
+        return os.fspath(self.config_manager.config_base_path)
+    
+    @functools.cached_property
+    def _rags_dir(self) -> str:
+        return os.path.join(self._configs_dir, "rags")
+    
+    @functools.cached_property
+    def _agents_yaml(self) -> str:
+        return os.path.join(self._configs_dir, "agents.yaml")
+    
+    @functools.cached_property
+    def _custom_agents_dir(self) -> str:
+        return os.path.join(os.fspath(self.base_path), "agentragmcp", "custom_agents")
+    
+    @functools.cached_property
+    def _documents_dir(self) -> str:
+        return os.path.join(os.fspath(self.base_path), "data", "documents")
+    
+    def migrate_full_system(self):
+        """Migra todo el sistema al nuevo formato"""
+        print("\n" + "="*60)
+        print("🚀 MIGRACIÓN COMPLETA A SISTEMA DINÁMICO")
+        print("="*60)
         
-        # Bonus por términos de espacios urbanos
-        urban_terms = [
-            "balcón", "terraza", "interior", "urbano", "maceta",
-            "apartamento", "espacio pequeño", "vertical"
+        # Fases en orden de dependencia; los pasos de una misma fase
+        # escriben archivos disjuntos y se ejecutan en paralelo
+        phases = [
+            [("📁 Crear estructura de directorios", self.setup_directory_structure)],
+            [("📋 Migrar configuraciones RAG", self.migrate_rag_configs),
+             ("🤖 Migrar configuraciones de agentes", self.migrate_agent_configs),
+             ("📚 Crear ejemplos personalizados", self.create_custom_examples),
+             ("🔄 Crear agentes personalizados", self.create_custom_agents)],
+            [("✅ Validar migración", self.validate_migration),
+             ("🧪 Pruebas de funcionalidad", self.test_migration),
+             ("📖 Crear documentación", self.create_migration_docs)],
+            [("🧹 Limpieza de archivos obsoletos", self.cleanup_old_files)]
         ]
         
-        question_lower = question.lower()
-        urban_matches = sum(1 for term in urban_terms if term in question_lower)
+        for phase in phases:
+            self._run_phase(phase)
         
-        if urban_matches > 0:
-            space_bonus = min(urban_matches * 0.15, 0.3)
-            confidence += space_bonus
+        print(f"\n🎉 ¡Migración completada exitosamente!")
+        print(f"\n📋 Próximos pasos:")
+        print(f"   1. Verificar configuraciones en data/configs/")
+        print(f"   2. Añadir documentos a data/documents/")
+        print(f"   3. Ejecutar proceso de vectorización")
+        print(f"   4. Probar la aplicación")
+    
+    def _run_phase(self, phase: List[Tuple[str, Callable[[], Any]]]):
+        """
+        Ejecuta una fase de la migración
         
-        return min(confidence, 1.0)
+        Args:
+            phase: Pasos (nombre, función) independientes entre sí
+        """
+        if len(phase) == 1:
+            step_name, step_func = phase[0]
+            print(f"\n{step_name}...")
+            error, _, elapsed = self._run_step(step_func)
+            self._report_step(step_name, error, elapsed)
+            return
+        
+        capture = _ThreadStdout(sys.stdout)
+        sys.stdout = capture
+        try:
+            with ThreadPoolExecutor(max_workers=len(phase)) as pool:
+                results = list(pool.map(lambda step: self._run_step(step[1], capture), phase))
+        finally:
+            sys.stdout = capture.target
+        
+        # Mostrar la salida de cada paso en el orden declarado
+        for (step_name, _), (error, output, elapsed) in zip(phase, results):
+            print(f"\n{step_name}...")
+            sys.stdout.write(output)
+            self._report_step(step_name, error, elapsed)
     
-    def enhance_response(self, response: str, question: str) -> str:
-        """Mejora la respuesta con enfoque urbano"""
-        enhanced = response
+    @staticmethod
+    def _run_step(step_func: Callable[[], Any],
+                  capture: Optional[_ThreadStdout] = None) -> Tuple[Optional[Exception], str, float]:
+        """
+        Ejecuta un paso midiendo su duración
         
-        # Añadir consideraciones de espacio
-        if any(term in question.lower() for term in ["cultivar", "plantar"]):
-            enhanced += "\\n\\n🏙️ **Adaptación Urbana**: Considera las limitaciones de espacio y contenedores."
+        Args:
+            step_func: Función del paso
+            capture: Captura de salida por hilo; si es None la salida es directa
+            
+        Returns:
+            Tuple[Optional[Exception], str, float]: Error (o None), salida capturada y segundos
+        """
+        start = time.perf_counter()
+        if capture is not None:
+            error, output = capture.run(step_func)
+        else:
+            error, output = None, ""
+            try:
+                step_func()
+            except Exception as e:
+                error = e
+        return error, output, time.perf_counter() - start
+    
+    @staticmethod
+    def _report_step(step_name: str, error: Optional[Exception], elapsed: float):
+        """Muestra el resultado de un paso y relanza su error si lo hubo"""
+        if error is not None:
+            print(f"❌ Error en {step_name}: {error}")
+            raise error
+        print(f"✅ {step_name} completado ({elapsed:.2f}s)")
+    
+    def setup_directory_structure(self):
+        """Crea la estructura de directorios para el sistema dinámico"""
+        directories = [
+            "data/configs/rags",
+            "data/configs/agents", 
+            "data/configs/custom",
+            "data/documents/plants",
+            "data/documents/pathology",
+            "data/documents/general",
+            "data/documents/eco_agriculture",
+            "data/documents/urban_gardening", 
+            "data/documents/permaculture",
+            "data/vectorstores/plants",
+            "data/vectorstores/pathology",
+            "data/vectorstores/general",
+            "data/vectorstores/eco_agriculture",
+            "data/vectorstores/urban_gardening",
+            "data/vectorstores/permaculture",
+            "agentragmcp/custom_agents",
+            "backups/migration"
+        ]
         
-        if "riego" in question.lower():
-            enhanced += "\\n\\n💧 **Riego Urbano**: Sistemas de autorriego son ideales para balcones."
+        base = os.fspath(self.base_path)
         
-        return enhanced
-'''
+        # Conjunto deduplicado de directorios y todos sus ancestros; ordenado de
+        # menor a mayor profundidad, cada uno se crea con un único os.mkdir
+        # (su padre ya existe), sin los re-stat de makedirs(parents=True)
+        unique = set()
+        for directory in directories:
+            parts = directory.split("/")
+            unique.update("/".join(parts[:i]) for i in range(1, len(parts) + 1))
+        
+        os.makedirs(base, exist_ok=True)
+        for directory in sorted(unique, key=lambda d: d.count("/")):
+            try:
+                os.mkdir(os.path.join(base, directory))
+            except FileExistsError:
+                pass
+        
+        # Un único volcado a stdout en vez de un print por directorio
+        if self.verbose:
+            sys.stdout.write("".join(f"   📁 {directory}\n" for directory in directories))
+        else:
+            print(f"   📁 {len(directories)} directorios preparados")
+        
+        # Crear archivo __init__.py para custom_agents
+        # O_EXCL comprueba y crea en una sola llamada, sin stat previo
+        init_file = os.path.join(base, "agentragmcp", "custom_agents", "__init__.py")
+        try:
+            fd = os.open(init_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b"# Custom agents module\n")
+    
+    def migrate_rag_configs(self):
+        """Migra las configuraciones RAG hardcodeadas a archivos individuales"""
+        
+        # Guardar configuraciones
+        rags_dir = self._rags_dir
+        
+        # Escribir en lote; los mensajes se muestran después, en orden
+        writer = _BatchWriter()
+        for topic_name, config_data in _RAG_CONFIGS.items():
+            writer.add_yaml(os.path.join(rags_dir, f"{topic_name}.yaml"), config_data)
+        written = writer.flush()
+        
+        _report_writes([("📋", f"{topic_name}.yaml", was_written)
+                        for topic_name, was_written in zip(_RAG_CONFIGS, written)],
+                       self.verbose)
+    
+    def migrate_agent_configs(self):
+        """Migra las configuraciones de agentes hardcodeadas"""
+        
+        # Guardar configuración de agentes
+        written = _dump_yaml(_AGENTS_CONFIG, self._agents_yaml)
+        
+        _report_writes([("🤖", f"agents.yaml con {len(_AGENTS_CONFIG['agents'])} agentes", written)])
+    
+    def create_custom_examples(self) -> Dict[str, int]:
+        """
+        Crea ejemplos de documentos para cada temática
+        
+        Returns:
+            Dict[str, int]: Documentos escritos y temáticas afectadas
+        """
+        
+        docs_dir = self._documents_dir
+        
+        # Un único scandir del directorio de documentos; solo se crean las
+        # temáticas que faltan, antes de lanzar las escrituras
+        try:
+            with os.scandir(docs_dir) as it:
+                existing = {entry.name for entry in it}
+        except FileNotFoundError:
+            os.makedirs(docs_dir, exist_ok=True)
+            existing = set()
+        for topic in set(_EXAMPLE_DOC_TOPICS) - existing:
+            try:
+                os.mkdir(os.path.join(docs_dir, topic))
+            except FileExistsError:
+                pass
+        
+        # El contenido solo se lee de las plantillas cuando la migración se ejecuta
+        writer = _BatchWriter()
+        for topic, filename in zip(_EXAMPLE_DOC_TOPICS, _EXAMPLE_DOC_FILENAMES):
+            with open(os.path.join(_EXAMPLE_DOCUMENTS_DIR, filename), 'rb') as f:
+                writer.add(os.path.join(docs_dir, topic, filename), f.read())
+        written = writer.flush()
+        
+        _report_writes([("📄", f"{topic}/{filename}", was_written)
+                        for topic, filename, was_written
+                        in zip(_EXAMPLE_DOC_TOPICS, _EXAMPLE_DOC_FILENAMES, written)],
+                       self.verbose)
+        
+        counts = {"documents": len(_EXAMPLE_DOC_FILENAMES),
+                  "topics": len(set(_EXAMPLE_DOC_TOPICS))}
+        self._step_counts.update(counts)
+        return counts
+    
+    def create_custom_agents(self):
+        """Crea agentes personalizados de ejemplo"""
         
         # Guardar agentes personalizados
-        custom_agents_path = self.base_path / "agentragmcp" / "custom_agents"
+        custom_agents_dir = self._custom_agents_dir
         
-        agents_to_create = [
-            ("eco_agriculture_agent.py", eco_agent_code),
-            ("urban_gardening_agent.py", urban_agent_code)
-        ]
+        writer = _BatchWriter()
+        for filename, spec in _CUSTOM_AGENT_SPECS:
+            writer.add(os.path.join(custom_agents_dir, filename), _render_agent(spec))
+        written = writer.flush()
+        
+        _report_writes([("🤖", filename, was_written)
+                        for (filename, _), was_written in zip(_CUSTOM_AGENT_SPECS, written)],
+                       self.verbose)
+    
+    # Sondas de validación: no imprimen nada, devuelven (recuento, mensaje, errores)
+    # para poder ejecutarse en paralelo y mostrarse después en orden
+    
+    def _probe_rag_configs(self) -> Tuple[int, Optional[str], List[str]]:
+        # La propia apertura del directorio sirve de comprobación de existencia
+        try:
+            with os.scandir(self._rags_dir) as entries:
+                rag_files = {entry.name for entry in entries
+                             if entry.name.endswith(".yaml") and not entry.name.startswith(".")}
+        except (FileNotFoundError, NotADirectoryError):
+            return 0, None, ["Directorio de configuraciones RAG no existe"]
+        
+        # Verificar configuraciones específicas
+        errors = [f"Configuración RAG faltante: {rag_name}"
+                  for rag_name in _MIGRATED_TOPICS if f"{rag_name}.yaml" not in rag_files]
+        return len(rag_files), f"   ✅ {len(rag_files)} configuraciones RAG encontradas", errors
+    
+    def _probe_agent_configs(self) -> Tuple[int, Optional[str], List[str]]:
+        # Solo hace falta el número de agentes, no el diccionario completo
+        try:
+            agent_count = _count_agents(self._agents_yaml)
+        except FileNotFoundError:
+            return 0, None, ["Archivo de configuración de agentes no existe"]
+        return agent_count, f"   ✅ {agent_count} agentes configurados", []
+    
+    def _probe_custom_agents(self) -> Tuple[int, Optional[str], List[str]]:
+        # Excluir __init__.py
+        try:
+            custom_count = _count_files(self._custom_agents_dir, ".py", ("__init__.py",))
+        except (FileNotFoundError, NotADirectoryError):
+            return 0, None, []
+        return custom_count, f"   ✅ {custom_count} agentes personalizados encontrados", []
+    
+    def _probe_documents(self, known_count: Optional[int] = None) -> Tuple[int, Optional[str], List[str]]:
+        if known_count is not None:
+            # Documentos escritos en este mismo proceso: no hace falta recorrer el árbol
+            total_docs = known_count
+        else:
+            total_docs = 0
+            try:
+                with os.scandir(self._documents_dir) as topic_dirs:
+                    for topic_dir in topic_dirs:
+                        if topic_dir.is_dir():
+                            total_docs += _count_files(topic_dir.path, ".txt")
+            except (FileNotFoundError, NotADirectoryError):
+                return 0, None, []
+        return total_docs, f"   ✅ {total_docs} documentos de ejemplo encontrados", []
+    
+    # Caché en disco de la validación, indexada por (mtime, tamaño) de lo comprobado
+    
+    @functools.cached_property
+    def _validation_cache_path(self) -> str:
+        return os.path.join(os.fspath(self.base_path), ".cache", "migration_validation.json")
+    
+    def _validation_cache_key(self, hints: Dict[str, int]) -> List[Any]:
+        """
+        Calcula la clave de la caché de validación
         
-        for filename, code in agents_to_create:
-            agent_file = custom_agents_path / filename
-            with open(agent_file, 'w', encoding='utf-8') as f:
-                f.write(code)
-            print(f"   🤖 {filename}")
+        Usa (st_mtime_ns, st_size) de cada ruta comprobada: el mtime de un
+        directorio cambia al crear o borrar entradas en él. Se devuelve como
+        listas para que sea comparable con la versión leída del JSON.
+        """
+        paths = [self._rags_dir, self._agents_yaml, self._custom_agents_dir, self._documents_dir]
+        if "documents" not in hints:
+            # Los documentos se cuentan dentro de cada temática
+            try:
+                with os.scandir(self._documents_dir) as topic_dirs:
+                    paths.extend(sorted(entry.path for entry in topic_dirs if entry.is_dir()))
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        
+        # La versión invalida resultados guardados con una forma de contar anterior
+        key: List[Any] = [_VALIDATION_CACHE_VERSION]
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                key.append([path, stat.st_mtime_ns, stat.st_size])
+            except FileNotFoundError:
+                key.append([path, None, None])
+        key.append(sorted([name, count] for name, count in hints.items()))
+        return key
     
-    def validate_migration(self):
-        """Valida que la migración se completó correctamente"""
+    def _load_validation_cache(self) -> Dict[str, Any]:
+        import json
+        try:
+            with open(self._validation_cache_path, 'rb') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_validation_cache(self, entry: Dict[str, Any]):
+        import json
+        try:
+            os.makedirs(os.path.dirname(self._validation_cache_path), exist_ok=True)
+            _write_bytes(self._validation_cache_path,
+                         json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+        except OSError as e:
+            print(f"   ⚠️ No se pudo guardar la caché de validación: {e}")
+    
+    def validate_migration(self, hints: Optional[Dict[str, int]] = None):
+        """
+        Valida que la migración se completó correctamente
+        
+        Args:
+            hints: Recuentos ya conocidos por los pasos anteriores (p. ej.
+                {"documents": 5}); por defecto, los registrados en este proceso.
+                Lo que no aparezca se comprueba en disco.
+        """
+        if hints is None:
+            hints = self._step_counts
+        
+        # Si nada de lo comprobado ha cambiado en disco, reutilizar la última validación
+        cache_key = self._validation_cache_key(hints)
+        cached = self._load_validation_cache()
+        if cached.get("key") == cache_key:
+            print("   ♻️ Sin cambios desde la última validación, se reutilizan sus resultados")
+            for message in cached["messages"]:
+                print(message)
+            return self._print_validation_summary(cached["results"])
+        
+        # Algo cambió en disco, quizá fuera de este proceso: los recuentos
+        # memorizados ya no son fiables
+        _count_files.cache_clear()
         
         validation_results = {
             "rag_configs": 0,
@@ -783,54 +1241,35 @@ class UrbanGardeningAgent(DynamicAgent):
             "documents": 0,
             "errors": []
         }
+        messages = []
         
-        # Verificar configuraciones RAG
-        rags_path = self.config_manager.config_base_path / "rags"
-        if rags_path.exists():
-            rag_files = list(rags_path.glob("*.yaml"))
-            validation_results["rag_configs"] = len(rag_files)
-            print(f"   ✅ {len(rag_files)} configuraciones RAG encontradas")
-            
-            # Verificar configuraciones específicas
-            expected_rags = ["plants", "pathology", "general", "eco_agriculture", "urban_gardening"]
-            for rag_name in expected_rags:
-                rag_file = rags_path / f"{rag_name}.yaml"
-                if not rag_file.exists():
-                    validation_results["errors"].append(f"Configuración RAG faltante: {rag_name}")
-        else:
-            validation_results["errors"].append("Directorio de configuraciones RAG no existe")
-        
-        # Verificar configuración de agentes
-        agents_file = self.config_manager.config_base_path / "agents.yaml"
-        if agents_file.exists():
-            with open(agents_file, 'r') as f:
-                agents_data = yaml.safe_load(f)
-            validation_results["agent_configs"] = len(agents_data.get("agents", {}))
-            print(f"   ✅ {validation_results['agent_configs']} agentes configurados")
-        else:
-            validation_results["errors"].append("Archivo de configuración de agentes no existe")
-        
-        # Verificar agentes personalizados
-        custom_agents_path = self.base_path / "agentragmcp" / "custom_agents"
-        if custom_agents_path.exists():
-            custom_files = list(custom_agents_path.glob("*.py"))
-            # Excluir __init__.py
-            custom_files = [f for f in custom_files if f.name != "__init__.py"]
-            validation_results["custom_agents"] = len(custom_files)
-            print(f"   ✅ {len(custom_files)} agentes personalizados encontrados")
-        
-        # Verificar documentos
-        docs_path = self.base_path / "data" / "documents"
-        if docs_path.exists():
-            total_docs = 0
-            for topic_dir in docs_path.iterdir():
-                if topic_dir.is_dir():
-                    docs = list(topic_dir.glob("*.txt"))
-                    total_docs += len(docs)
-            validation_results["documents"] = total_docs
-            print(f"   ✅ {total_docs} documentos de ejemplo encontrados")
-        
-        # Mostrar resumen
+        # Las cuatro comprobaciones son independientes y dominadas por el
+        # sistema de archivos: se lanzan a la vez
+        probes = [
+            ("rag_configs", self._probe_rag_configs),
+            ("agent_configs", self._probe_agent_configs),
+            ("custom_agents", self._probe_custom_agents),
+            ("documents", functools.partial(self._probe_documents, hints.get("documents")))
+        ]
+        with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+            futures = [pool.submit(probe) for _, probe in probes]
+        
+        # Resultados en el orden declarado para que la salida sea determinista
+        for (key, _), future in zip(probes, futures):
+            count, message, errors = future.result()
+            validation_results[key] = count
+            validation_results["errors"].extend(errors)
+            if message:
+                print(message)
+                messages.append(message)
+        
+        self._save_validation_cache({"key": cache_key,
+                                     "messages": messages,
+                                     "results": validation_results})
+        return self._print_validation_summary(validation_results)
+    
+    def _print_validation_summary(self, validation_results: Dict[str, Any]) -> bool:
+        """Muestra el resumen de la validación y devuelve si fue correcta"""
         if validation_results["errors"]:
             print(f"\n   ⚠️ Errores encontrados:")
             for error in validation_results["errors"]:
@@ -873,277 +1312,22 @@ class UrbanGardeningAgent(DynamicAgent):
     def create_migration_docs(self):
         """Crea documentación sobre el sistema migrado"""
         
-        readme_content = f"""# 🌱 AgentRagMCP - Sistema Dinámico de Configuración
-
-## 📋 Resumen de la Migración
-
-Este sistema ha sido migrado de configuración hardcodeada a un sistema dinámico y flexible que permite:
-
-✅ **RAGs Configurables**: Cada temática tiene su propio archivo de configuración
-✅ **Agentes Dinámicos**: Los agentes se cargan automáticamente desde configuración
-✅ **Extensibilidad**: Fácil adición de nuevas temáticas y agentes sin modificar código
-✅ **Recarga Automática**: Cambios en configuración se detectan y aplican automáticamente
-
-## 📁 Estructura de Configuración
-
-```
-data/configs/
-├── rags/                          # Configuraciones de RAG por temática
-│   ├── plants.yaml               # Información general de plantas
-│   ├── pathology.yaml            # Patologías y enfermedades
-│   ├── general.yaml              # Conocimiento general
-│   ├── eco_agriculture.yaml      # Agricultura ecológica (ejemplo)
-│   └── urban_gardening.yaml      # Jardinería urbana (ejemplo)
-├── agents.yaml                   # Configuración de todos los agentes
-└── custom/                       # Configuraciones personalizadas
-
-agentragmcp/custom_agents/         # Agentes personalizados
-├── eco_agriculture_agent.py      # Ejemplo de agente personalizado
-└── __init__.py
-```
-
-## 🚀 Cómo Añadir Nuevos RAGs
-
-### 1. Crear Configuración RAG
-
-Crea un archivo `mi_nueva_tematica.yaml` en `data/configs/rags/`:
-
-```yaml
-display_name: "Mi Nueva Temática"
-description: "Descripción de la temática"
-enabled: true
-priority: 1
-
-vectorstore:
-  type: "chroma"
-  path: "./data/vectorstores/mi_nueva_tematica"
-  collection_name: "mi_nueva_tematica_collection"
-  chunk_size: 1000
-  chunk_overlap: 200
-
-retrieval:
-  search_type: "mmr"
-  k: 5
-  lambda_mult: 0.7
-
-system_prompt: |
-  Eres un especialista en [tu temática].
-  
-  **Especialidades:**
-  - Lista tus especialidades
-  
-  {{context}}
-
-categories: ["categoria1", "categoria2"]
-keywords:
-  primary: ["palabra1", "palabra2"]
-  secondary: ["palabra3", "palabra4"]
-
-source_paths: ["./data/documents/mi_nueva_tematica"]
-```
-
-### 2. Añadir Documentos
-
-- Crea directorio: `data/documents/mi_nueva_tematica/`
-- Añade documentos en formato `.txt`, `.pdf`, `.md`
-- Ejecuta script de procesamiento para crear vectorstore
-
-### 3. El Sistema se Encarga del Resto
-
-El sistema detectará automáticamente la nueva configuración y cargará el RAG.
-
-## 🤖 Cómo Añadir Nuevos Agentes
-
-### 1. Agente Genérico (Solo Configuración)
-
-Añade a `data/configs/agents.yaml`:
-
-```yaml
-agents:
-  mi_agente:
-    description: "Descripción del agente"
-    class: "GenericRAGAgent"  # Usa agente genérico
-    topics: ["mi_nueva_tematica"]
-    enabled: true
-    priority: 2
-    config:
-      primary_keywords: ["palabra1", "palabra2"]
-      patterns: ["patrón.*regex"]
-      target_species: ["Especie específica"]
-    thresholds:
-      keyword_weight: 0.4
-      pattern_weight: 0.3
-```
-
-### 2. Agente Personalizado (Con Código)
-
-1. Crea archivo en `agentragmcp/custom_agents/mi_agente.py`
-2. Hereda de `DynamicAgent`
-3. Implementa lógica específica
-4. Actualiza configuración en `agents.yaml`
-
-## 🔧 Comandos Útiles
-
-```bash
-# Migrar sistema completo
-python scripts/migration_dinamic.py
-
-# Validar configuraciones
-python -c "from agentragmcp.core.dynamic_config import config_manager; config_manager.validate_all()"
-
-# Recargar configuraciones
-python -c "from agentragmcp.core.dynamic_config import config_manager; config_manager.reload_if_changed()"
-
-# Listar configuraciones disponibles
-python -c "from agentragmcp.core.dynamic_config import config_manager; print(config_manager.list_available_configs())"
-```
-
-## 📝 Ejemplos Incluidos
-
-La migración incluye configuraciones de ejemplo para:
-
-- **🌱 Plants**: Información general de plantas
-- **🦠 Pathology**: Diagnóstico y tratamiento de enfermedades
-- **📚 General**: Conocimiento educativo de botánica
-- **🌿 Eco Agriculture**: Agricultura ecológica y sostenible
-- **🏙️ Urban Gardening**: Jardinería en espacios urbanos
-
-## 🛠️ Desarrollo y Personalización
-
-### Estructura de un Agente Personalizado
-
-```python
-from agentragmcp.api.app.agents.dinamic_agent import DynamicAgent
-
-class MiAgentePersonalizado(DynamicAgent):
-    def __init__(self, config, rag_service):
-        super().__init__("mi_tematica", config, rag_service)
-    
-    def calculate_confidence(self, question: str) -> float:
-        # Lógica personalizada de confianza
-        confidence = super().calculate_confidence(question)
-        # Añadir bonificaciones específicas
-        return confidence
-    
-    def enhance_response(self, response: str, question: str) -> str:
-        # Mejoras específicas a las respuestas
-        return enhanced_response
-```
-
-### Configuración Avanzada de RAG
-
-```yaml
-# Configuración avanzada con múltiples fuentes
-vectorstore:
-  type: "chroma"
-  path: "./data/vectorstores/mi_rag"
-  collection_name: "mi_collection"
-  chunk_size: 1200
-  chunk_overlap: 300
-  embedding_model: "llama3.1"
-
-retrieval:
-  search_type: "mmr"
-  k: 6
-  fetch_k: 20
-  lambda_mult: 0.8
-  score_threshold: 0.4
-
-# Configuraciones personalizadas
-custom_settings:
-  use_metadata_filter: true
-  include_source_info: true
-  max_context_length: 4000
-  response_language: "es"
-```
-
-## 📊 Monitoreo y Métricas
-
-El sistema incluye capacidades de monitoreo:
-
-- **Carga de configuraciones**: Tiempo y éxito de carga
-- **Uso de agentes**: Frecuencia de selección por agente
-- **Performance de RAGs**: Tiempo de respuesta por temática
-- **Detección de cambios**: Recargas automáticas de configuración
-
-## 🔄 Proceso de Migración Completado
-
-La migración automática ha:
-
-1. ✅ Creado estructura de directorios
-2. ✅ Extraído configuraciones hardcodeadas
-3. ✅ Generado archivos YAML de configuración
-4. ✅ Creado agentes personalizados de ejemplo
-5. ✅ Añadido documentos de ejemplo
-6. ✅ Validado la migración
-7. ✅ Generado esta documentación
-
-## 📞 Soporte
-
-Para más información sobre el sistema dinámico:
-- Revisa los archivos de configuración en `data/configs/`
-- Consulta los ejemplos en `agentragmcp/custom_agents/`
-- Ejecuta las validaciones incluidas
-- Revisa los logs del sistema para debugging
-
----
-
-**¡El sistema AgentRagMCP ahora es completamente dinámico y extensible!** 🎉
-"""
-        
-        # Guardar documentación
-        readme_file = self.base_path / "MIGRATION_README.md"
-        with open(readme_file, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        
-        # Crear archivo de configuración de ejemplo
-        example_config = """# Ejemplo de configuración personalizada
-
-display_name: "Mi RAG Personalizado"
-description: "Ejemplo de cómo crear un RAG personalizado"
-enabled: true
-priority: 10
-
-vectorstore:
-  type: "chroma"
-  path: "./data/vectorstores/mi_rag_personalizado"
-  collection_name: "mi_collection"
-  chunk_size: 1000
-  chunk_overlap: 200
-
-retrieval:
-  search_type: "mmr"
-  k: 5
-  lambda_mult: 0.7
-
-system_prompt: |
-  Eres un especialista en [tu área específica].
-  
-  Proporciona información precisa y útil sobre [tu dominio].
-  
-  {context}
-
-categories: ["categoria1", "categoria2"]
-keywords:
-  primary: ["palabra_clave1", "palabra_clave2"]
-  secondary: ["término1", "término2"]
-
-source_paths: ["./data/documents/mi_rag_personalizado"]
-
-custom_settings:
-  mi_configuracion: "valor"
-  otra_opcion: true
-"""
+        # Guardar documentación y configuración de ejemplo en un solo lote
+        writer = _BatchWriter()
+        writer.add(self.base_path / "MIGRATION_README.md", _MIGRATION_README_TEMPLATE.read_bytes())
+        writer.add(os.path.join(self._configs_dir, "custom", "ejemplo_rag.yaml"),
+                   _EXAMPLE_RAG_TEMPLATE.read_bytes())
+        readme_written, example_written = writer.flush()
         
-        example_file = self.config_manager.config_base_path / "custom" / "ejemplo_rag.yaml"
-        with open(example_file, 'w', encoding='utf-8') as f:
-            f.write(example_config)
-        
-        print(f"   📖 MIGRATION_README.md")
-        print(f"   📋 ejemplo_rag.yaml")
+        _report_writes([("📖", "MIGRATION_README.md", readme_written),
+                        ("📋", "ejemplo_rag.yaml", example_written)],
+                       self.verbose)
     
     def cleanup_old_files(self):
         """Limpia archivos obsoletos después de la migración"""
+        import json
+        import shutil
+        
         print("   🗂️ Creando backups de archivos originales...")
         
         # Archivos que podrían necesitar backup
@@ -1190,8 +1374,7 @@ custom_settings:
         }
         
         log_file = backup_dir / "migration_log.json"
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(migration_log, f, indent=2, ensure_ascii=False)
+        _write_bytes(log_file, json.dumps(migration_log, indent=2, ensure_ascii=False).encode('utf-8'))
         
         print(f"   📋 Log de migración guardado en backups/migration/migration_log.json")
 
@@ -1207,7 +1390,7 @@ def main():
     args = parser.parse_args()
     
     try:
-        migrator = AgentRagMCPMigrator(args.base_path)
+        migrator = AgentRagMCPMigrator(args.base_path, verbose=args.verbose)
         
         if args.dry_run:
             print("🧪 MODO DRY-RUN - No se realizarán cambios")
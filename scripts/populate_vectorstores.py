@@ -5,6 +5,9 @@ Script para poblar los vectorstores de AgentRagMCP
 
 import os
 import logging
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict
 import yaml
@@ -15,35 +18,63 @@ from langchain_community.document_loaders import (
     PyPDFLoader,
     CSVLoader
 )
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import Chroma
-from langchain_community.embeddings import OllamaEmbeddings
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cargador por extensión de archivo, en el orden en que se procesan
+_DOCUMENT_LOADERS = {
+    "txt": lambda path: TextLoader(path, encoding='utf-8'),
+    "pdf": PyPDFLoader,
+    "csv": CSVLoader
+}
+
+def _batched(items: List, size: int):
+    """Divide una lista en lotes consecutivos de como máximo `size` elementos"""
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
 class VectorStorePopulator:
     """Poblador de vectorstores para AgentRagMCP"""
     
-    def __init__(self, base_path: str = "./data", embedding_model: str = "hdnh2006/salamandra-7b-instruct:latest"):
+    def __init__(self, base_path: str = "./data", embedding_model: str = "hdnh2006/salamandra-7b-instruct:latest",
+                 batch_size: int = 64, embedding_workers: int = 4):
         self.base_path = Path(base_path)
         self.vectorstore_path = self.base_path / "vectorstores"
         self.documents_path = self.base_path / "documents"
         self.embedding_model = embedding_model
         
+        # Los chunks se embeben por lotes, con varias peticiones a Ollama en vuelo
+        self.batch_size = batch_size
+        self.embedding_workers = embedding_workers
+        
         # Crear directorios si no existen
         self.vectorstore_path.mkdir(parents=True, exist_ok=True)
         self.documents_path.mkdir(parents=True, exist_ok=True)
-        
-        # Configuración de embeddings
-        self.embeddings = OllamaEmbeddings(
-            model=embedding_model,
+    
+    # Embeddings y splitter se crean al primer uso: consultar temáticas o crear
+    # documentos de ejemplo no necesita conectar con Ollama
+    
+    @functools.cached_property
+    def embeddings(self):
+        """Configuración de embeddings"""
+        from langchain_community.embeddings import OllamaEmbeddings
+        return OllamaEmbeddings(
+            model=self.embedding_model,
             base_url="http://localhost:11434"
         )
-        
-        # Configuración de text splitter
-        self.text_splitter = RecursiveCharacterTextSplitter(
+    
+    @functools.cached_property
+    def text_splitter(self):
+        """Configuración de text splitter"""
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        return RecursiveCharacterTextSplitter(
             chunk_size=1000,
             chunk_overlap=200,
             length_function=len,
@@ -144,41 +175,31 @@ Formatos soportados: .txt, .pdf, .csv, .md
         """Carga documentos para una temática específica"""
         topic_dir = self.documents_path / topic
         
-        if not topic_dir.exists():
+        # Un único recorrido del directorio, agrupando por extensión para
+        # mantener el orden de carga texto -> PDF -> CSV
+        files_by_ext = {ext: [] for ext in _DOCUMENT_LOADERS}
+        try:
+            with os.scandir(topic_dir) as entries:
+                for entry in entries:
+                    # Mismos archivos que glob("*.<ext>"): extensión sensible a
+                    # mayúsculas y sin excluir los ocultos
+                    _, dot, ext = entry.name.rpartition('.')
+                    if dot and ext in files_by_ext and entry.is_file():
+                        files_by_ext[ext].append(entry.path)
+        except FileNotFoundError:
             logger.warning(f"Directorio no encontrado: {topic_dir}")
             return []
         
         documents = []
-        
-        # Cargar archivos de texto
-        for txt_file in topic_dir.glob("*.txt"):
-            try:
-                loader = TextLoader(str(txt_file), encoding='utf-8')
-                docs = loader.load()
-                documents.extend(docs)
-                logger.info(f"Cargado: {txt_file}")
-            except Exception as e:
-                logger.error(f"Error cargando {txt_file}: {e}")
-        
-        # Cargar archivos PDF
-        for pdf_file in topic_dir.glob("*.pdf"):
-            try:
-                loader = PyPDFLoader(str(pdf_file))
-                docs = loader.load()
-                documents.extend(docs)
-                logger.info(f"Cargado: {pdf_file}")
-            except Exception as e:
-                logger.error(f"Error cargando {pdf_file}: {e}")
-        
-        # Cargar archivos CSV
-        for csv_file in topic_dir.glob("*.csv"):
-            try:
-                loader = CSVLoader(str(csv_file))
-                docs = loader.load()
-                documents.extend(docs)
-                logger.info(f"Cargado: {csv_file}")
-            except Exception as e:
-                logger.error(f"Error cargando {csv_file}: {e}")
+        for ext, file_paths in files_by_ext.items():
+            loader_factory = _DOCUMENT_LOADERS[ext]
+            for file_path in file_paths:
+                try:
+                    docs = loader_factory(file_path).load()
+                    documents.extend(docs)
+                    logger.info(f"Cargado: {file_path}")
+                except Exception as e:
+                    logger.error(f"Error cargando {file_path}: {e}")
         
         return documents
     
@@ -202,13 +223,18 @@ Formatos soportados: .txt, .pdf, .csv, .md
             vectorstore_dir = self.vectorstore_path / topic
             vectorstore_dir.mkdir(exist_ok=True)
             
-            vectorstore = Chroma.from_documents(
-                documents=text_chunks,
-                embedding=self.embeddings,
-                persist_directory=str(vectorstore_dir),
-                collection_name=f"{topic}_collection"
+            vectorstore = Chroma(
+                collection_name=f"{topic}_collection",
+                embedding_function=self.embeddings,
+                persist_directory=str(vectorstore_dir)
             )
             
+            # Añadir por lotes: las peticiones de embeddings son E/S y se solapan
+            batches = _batched(text_chunks, self.batch_size)
+            with ThreadPoolExecutor(max_workers=self.embedding_workers) as pool:
+                for _ in pool.map(vectorstore.add_documents, batches):
+                    pass
+            
             # Persistir
             vectorstore.persist()
             